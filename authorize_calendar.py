@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - Google Calendar Authorization
+
+Runs the interactive OAuth flow once (opens a browser) and saves the token
+that the web app then uses and refreshes on its own:
+
+    python authorize_calendar.py
+"""
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from config.config import Config
+from backend.utils.calendar_integration import GoogleCalendarIntegration
+
+
+def main():
+    calendar = GoogleCalendarIntegration(
+        credentials_file=Config.GOOGLE_CREDENTIALS_FILE,
+        token_file=Config.GOOGLE_TOKEN_FILE
+    )
+    calendar.authorize()
+    print(f"Saved Google Calendar token to {Config.GOOGLE_TOKEN_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
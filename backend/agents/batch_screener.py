@@ -0,0 +1,262 @@
+import copy
+import hashlib
+import importlib.util
+import json
+import os
+import re
+from concurrent.futures import as_completed
+from dataclasses import asdict
+from typing import Callable, Dict, List, Tuple
+import pandas as pd
+from backend.models.candidate import Candidate, CandidateScore, JobDescription
+from backend.agents.resume_processor import ResumeProcessor
+from backend.agents.candidate_ranker import CandidateRanker
+from backend.utils.ingestion import ResumeIngestionPool
+
+
+class BatchScreener:
+    """Offline screening of a resume directory against many job descriptions.
+    
+    Resumes are parsed once (in the ingestion process pool) and shared by all
+    jobs, and all jobs are ranked together as one score matrix, so each
+    resume is embedded once.
+    Progress is checkpointed to ``checkpoint_dir``: parsed resumes are
+    appended to ``parsed.jsonl`` as they finish and each finished job is
+    marked done, so an interrupted run picks up where it stopped. Failed
+    parses are not checkpointed and are retried on the next run, and
+    entries from another parser version are parsed again. A done
+    marker records a hash of the job and of the screened resumes, so a job
+    is redone when its description or the resume set changes.
+    """
+    
+    OUTPUT_FORMATS = ('csv', 'parquet')
+    
+    def __init__(self,
+                 resume_processor: ResumeProcessor,
+                 candidate_ranker: CandidateRanker,
+                 ingestion_pool: ResumeIngestionPool,
+                 checkpoint_dir: str,
+                 log: Callable[[str], None] = print):
+        self.resume_processor = resume_processor
+        self.candidate_ranker = candidate_ranker
+        self.ingestion_pool = ingestion_pool
+        self.checkpoint_dir = checkpoint_dir
+        self.log = log
+        os.makedirs(os.path.join(self.checkpoint_dir, 'jobs'), exist_ok=True)
+    
+    @classmethod
+    def check_output_format(cls, output_format: str):
+        """Raise ValueError for unknown formats or a missing parquet engine"""
+        if output_format not in cls.OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        if output_format == 'parquet' and not any(
+            importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet')
+        ):
+            raise ValueError("Parquet output needs pyarrow: pip install pyarrow (or use --format csv)")
+    
+    @staticmethod
+    def load_jobs(job_files: List[str]) -> List[Tuple[str, JobDescription]]:
+        """Load (job_id, JobDescription) pairs from JSON files.
+        
+        Each file holds one job object or a list of them, with the
+        JobDescription fields; ``required_skills`` may be a list or a
+        comma-separated string. ``id`` defaults to the file name and title.
+        """
+        jobs = []
+        for job_file in job_files:
+            with open(job_file) as f:
+                data = json.load(f)
+            entries = data if isinstance(data, list) else [data]
+            base_name = os.path.splitext(os.path.basename(job_file))[0]
+            for index, entry in enumerate(entries):
+                skills = entry.get('required_skills', [])
+                if isinstance(skills, str):
+                    skills = [s.strip() for s in skills.split(',') if s.strip()]
+                job = JobDescription(
+                    title=entry.get('title', ''),
+                    description=entry.get('description', ''),
+                    required_skills=skills,
+                    experience_required=entry.get('experience_required', ''),
+                    qualifications=entry.get('qualifications', '')
+                )
+                default_id = base_name if len(entries) == 1 else f"{base_name}_{index + 1}"
+                job_id = re.sub(r'[^A-Za-z0-9_.-]+', '_', entry.get('id') or default_id)
+                jobs.append((job_id, job))
+        return jobs
+    
+    def parse_directory(self, resume_dir: str) -> List[Candidate]:
+        """Parse every PDF under resume_dir, reusing checkpointed results"""
+        checkpoint_path = os.path.join(self.checkpoint_dir, 'parsed.jsonl')
+        parser_version = self.resume_processor.pdf_parser.version
+        parsed = self._load_parsed_checkpoint(checkpoint_path, parser_version)
+        
+        # content_hash -> path; identical files are only parsed once
+        paths = {}
+        for root, _, files in os.walk(resume_dir):
+            for name in sorted(files):
+                if name.lower().endswith('.pdf'):
+                    path = os.path.join(root, name)
+                    paths.setdefault(self._hash_file(path), path)
+        
+        pending = {
+            self.ingestion_pool.submit(path, content_hash): content_hash
+            for content_hash, path in paths.items()
+            if content_hash not in parsed
+        }
+        if pending:
+            self.log(f"Parsing {len(pending)} resumes ({len(paths) - len(pending)} from checkpoint)...")
+        with open(checkpoint_path, 'a') as checkpoint:
+            for done, future in enumerate(as_completed(pending), start=1):
+                content_hash = pending[future]
+                try:
+                    fields = future.result()
+                except Exception as e:
+                    fields = None
+                    self.log(f"Error parsing {paths[content_hash]}: {str(e)}")
+                # Failures are not checkpointed, so the next run tries them again
+                if fields:
+                    entry = {'content_hash': content_hash, 'parser_version': parser_version, 'fields': fields}
+                    checkpoint.write(json.dumps(entry) + '\n')
+                    checkpoint.flush()
+                    parsed[content_hash] = entry
+                if done % 50 == 0 or done == len(pending):
+                    self.log(f"  parsed {done}/{len(pending)}")
+        
+        candidates = []
+        for content_hash, path in paths.items():
+            if content_hash not in parsed:
+                continue
+            candidate = self.resume_processor.candidate_from_fields(path, parsed[content_hash]['fields'])
+            if candidate:
+                candidate.content_hash = content_hash
+                candidates.append(candidate)
+        return candidates
+    
+    def run(self,
+            resume_dir: str,
+            jobs: List[Tuple[str, JobDescription]],
+            output_dir: str,
+            output_format: str = 'csv',
+            summarize: bool = False) -> Dict[str, str]:
+        """Screen all resumes against all jobs; returns job_id -> output file"""
+        self.check_output_format(output_format)
+        os.makedirs(output_dir, exist_ok=True)
+        
+        candidates = self.parse_directory(resume_dir)
+        candidates = self.resume_processor.finalize_candidates(candidates, None, summarize=False)
+        self.log(f"{len(candidates)} unique candidates")
+        resume_key = self._resume_key(candidates)
+        
+        outputs = {}
+        pending = []
+        for job_id, job in jobs:
+            output_path = os.path.join(output_dir, f"{job_id}.{output_format}")
+            done_marker = os.path.join(self.checkpoint_dir, 'jobs', f"{job_id}.done")
+            run_key = self._run_key(job, resume_key, output_path, summarize)
+            if self._is_done(done_marker, run_key) and os.path.exists(output_path):
+                self.log(f"Skipping {job_id} (already done)")
+                outputs[job_id] = output_path
+            else:
+                pending.append((job_id, job, output_path, done_marker, run_key))
+        
+        if not pending:
+            return outputs
+        
+        # All remaining jobs are scored together as one (jobs x candidates) matrix
+        self.log(f"Ranking {len(candidates)} candidates for {len(pending)} jobs...")
+        rankings = self.candidate_ranker.rank_candidates_multi(candidates, [p[1] for p in pending])
+        
+        for (job_id, job, output_path, done_marker, run_key), ranking in zip(pending, rankings):
+            summaries = [''] * len(ranking)
+            if summarize:
+                # Copies, so one job's summaries never leak into another's
+                job_candidates = [copy.copy(score.candidate) for score in ranking]
+                self.resume_processor.finalize_candidates(job_candidates, job, deduplicate=False)
+                summaries = [c.summary for c in job_candidates]
+            self._write_results(output_path, output_format, job_id, job, ranking, summaries)
+            
+            with open(done_marker, 'w') as marker:
+                json.dump({'key': run_key, 'output': output_path}, marker)
+            outputs[job_id] = output_path
+        
+        return outputs
+    
+    @staticmethod
+    def _resume_key(candidates: List[Candidate]) -> str:
+        """Hash of the screened resume set: file names and content hashes"""
+        hasher = hashlib.sha256()
+        for entry in sorted((c.content_hash or '', c.filename) for c in candidates):
+            hasher.update(json.dumps(entry).encode('utf-8'))
+        return hasher.hexdigest()
+    
+    @staticmethod
+    def _run_key(job: JobDescription, resume_key: str, output_path: str, summarize: bool) -> str:
+        """Hash identifying one job's output: job fields, resumes, output file and options"""
+        data = {'job': asdict(job), 'resumes': resume_key, 'output': output_path, 'summarize': summarize}
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _is_done(done_marker: str, run_key: str) -> bool:
+        """True if the marker was written for exactly this job and resume set"""
+        try:
+            with open(done_marker) as marker:
+                return json.load(marker).get('key') == run_key
+        except (OSError, ValueError, AttributeError):
+            # Missing, or written by an older version without a key
+            return False
+    
+    def _write_results(self, output_path: str, output_format: str, job_id: str,
+                       job: JobDescription, ranking: List[CandidateScore], summaries: List[str]):
+        rows = []
+        for rank, (score, summary) in enumerate(zip(ranking, summaries), start=1):
+            candidate = score.candidate
+            rows.append({
+                'job_id': job_id,
+                'job_title': job.title,
+                'rank': rank,
+                'name': candidate.name,
+                'email': candidate.email,
+                'phone': candidate.phone or '',
+                'experience': candidate.experience,
+                'skills': ', '.join(candidate.skills),
+                'skill_match_score': round(score.skill_match_score * 100, 2),
+                'experience_score': round(score.experience_score * 100, 2),
+                'overall_score': round(score.overall_score * 100, 2),
+                'summary': summary,
+                'file': candidate.filename,
+                'merged_files': ', '.join(candidate.merged_files)
+            })
+        
+        frame = pd.DataFrame(rows)
+        # Write to a temporary file first so a crash never leaves a partial output
+        temp_path = output_path + '.part'
+        if output_format == 'parquet':
+            frame.to_parquet(temp_path, index=False)
+        else:
+            frame.to_csv(temp_path, index=False)
+        os.replace(temp_path, output_path)
+    
+    @staticmethod
+    def _load_parsed_checkpoint(checkpoint_path: str, parser_version: str) -> Dict[str, Dict]:
+        """Checkpointed parses by content hash, for the given parser version only"""
+        parsed = {}
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as checkpoint:
+                for line in checkpoint:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Last line of an interrupted run may be truncated
+                        continue
+                    # Entries without a version predate it and may be failed parses
+                    if entry.get('parser_version') == parser_version and entry.get('fields'):
+                        parsed[entry['content_hash']] = entry
+        return parsed
+    
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
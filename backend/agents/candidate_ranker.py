@@ -1,122 +1,318 @@
+import heapq
+import re
+import threading
+from collections import OrderedDict
 import numpy as np
 from typing import List, Dict, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
-from ..models.candidate import Candidate, JobDescription
+from ..models.candidate import Candidate, CandidateScore, JobDescription
+from backend.utils.inference_client import get_embedding_model
+from config.config import Config
 
 class CandidateRanker:
     def __init__(self):
-        self.embedding_model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+        # Local model, or thin client of the inference server (Config.INFERENCE_SOCKET)
+        self.embedding_model = get_embedding_model()
         self.weights = {
             'skills_match': 0.4,
             'experience_relevance': 0.3,
             'overall_fit': 0.3
         }
+        
+        # Overall-fit scoring mode (see Config.OVERALL_FIT_MODE)
+        self.overall_fit_mode = Config.OVERALL_FIT_MODE
+        self.chunk_max_chars = Config.CHUNK_MAX_CHARS
+        self.chunk_aggregation = Config.CHUNK_AGGREGATION
+        self.chunk_top_k = Config.CHUNK_TOP_K
+        self.batch_size = Config.EMBEDDING_BATCH_SIZE
+        
+        # LRU cache of text -> embedding, so re-ranking the same pool for
+        # another job only embeds the new job text
+        self.embedding_cache_size = Config.EMBEDDING_CACHE_SIZE
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
     
     def rank_candidates(self, candidates: List[Candidate], job_description: JobDescription) -> List[Candidate]:
         """Rank candidates based on job description matching"""
+        scores = self.score_matrix(candidates, [job_description])
         
-        for candidate in candidates:
-            # Calculate individual scores
-            skills_score = self._calculate_skills_match(candidate, job_description)
-            experience_score = self._calculate_experience_relevance(candidate, job_description)
-            overall_fit_score = self._calculate_overall_fit(candidate, job_description)
-            
-            # Calculate weighted overall score
-            overall_score = (
-                skills_score * self.weights['skills_match'] +
-                experience_score * self.weights['experience_relevance'] +
-                overall_fit_score * self.weights['overall_fit']
-            )
-            
+        for index, candidate in enumerate(candidates):
             # Update candidate scores
-            candidate.skill_match_score = skills_score
-            candidate.experience_score = experience_score
-            candidate.overall_score = overall_score
+            candidate.skill_match_score = float(scores['skills_match'][0, index])
+            candidate.experience_score = float(scores['experience_relevance'][0, index])
+            candidate.overall_score = float(scores['overall'][0, index])
         
         # Sort candidates by overall score (descending)
         ranked_candidates = sorted(candidates, key=lambda x: x.overall_score, reverse=True)
         
         return ranked_candidates
     
-    def _calculate_skills_match(self, candidate: Candidate, job_description: JobDescription) -> float:
+    def merge_ranked(self, ranked_candidates: List[Candidate], new_ranked: List[Candidate]) -> List[Candidate]:
+        """Merge two score-sorted lists in O(N + M) instead of re-sorting"""
+        return list(heapq.merge(ranked_candidates, new_ranked, key=lambda x: -x.overall_score))
+    
+    def rank_candidates_multi(self, candidates: List[Candidate],
+                              job_descriptions: List[JobDescription]) -> List[List[CandidateScore]]:
+        """Rank one candidate pool against several jobs at once.
+        
+        Candidates and jobs are each embedded once and all K x N scores are
+        computed as matrices. Returns one ranking per job (in the order of
+        ``job_descriptions``); the candidate objects are not modified.
+        """
+        scores = self.score_matrix(candidates, job_descriptions)
+        
+        rankings = []
+        for job_index in range(len(job_descriptions)):
+            order = np.argsort(-scores['overall'][job_index], kind='stable')
+            rankings.append([
+                CandidateScore(
+                    candidate=candidates[i],
+                    skill_match_score=float(scores['skills_match'][job_index, i]),
+                    experience_score=float(scores['experience_relevance'][job_index, i]),
+                    overall_fit_score=float(scores['overall_fit'][job_index, i]),
+                    overall_score=float(scores['overall'][job_index, i])
+                )
+                for i in order
+            ])
+        return rankings
+    
+    def score_matrix(self, candidates: List[Candidate],
+                     job_descriptions: List[JobDescription]) -> Dict[str, np.ndarray]:
+        """Compute (jobs x candidates) score matrices.
+        
+        Returns a dict with 'skills_match', 'experience_relevance',
+        'overall_fit' and the weighted 'overall' score, each of shape
+        (len(job_descriptions), len(candidates)).
+        """
+        skills_scores = self._calculate_skills_match(candidates, job_descriptions)
+        experience_scores = self._calculate_experience_relevance(candidates, job_descriptions)
+        if self.overall_fit_mode == 'chunked':
+            overall_fit_scores = self._calculate_chunked_overall_fit(candidates, job_descriptions)
+        else:
+            overall_fit_scores = self._calculate_overall_fit(candidates, job_descriptions)
+        
+        # Calculate weighted overall score
+        overall_scores = (
+            skills_scores * self.weights['skills_match'] +
+            experience_scores * self.weights['experience_relevance'] +
+            overall_fit_scores * self.weights['overall_fit']
+        )
+        
+        return {
+            'skills_match': skills_scores,
+            'experience_relevance': experience_scores,
+            'overall_fit': overall_fit_scores,
+            'overall': overall_scores
+        }
+    
+    def _calculate_skills_match(self, candidates: List[Candidate],
+                                job_descriptions: List[JobDescription]) -> np.ndarray:
         """Calculate how well candidate skills match job requirements"""
+        scores = np.zeros((len(job_descriptions), len(candidates)), dtype=np.float32)
         try:
-            if not candidate.skills or not job_description.required_skills:
-                return 0.0
+            if not candidates or not job_descriptions:
+                return scores
             
-            candidate_skills_text = ' '.join(candidate.skills).lower()
-            required_skills_text = ' '.join(job_description.required_skills).lower()
+            candidate_skills = [[skill.lower() for skill in c.skills] for c in candidates]
+            required_skills = [[skill.lower() for skill in j.required_skills] for j in job_descriptions]
             
             # Use embedding similarity
-            similarity = self._get_text_similarity(candidate_skills_text, required_skills_text)
+            candidate_embeddings = self._normalize(self.encode([' '.join(s) for s in candidate_skills]))
+            job_embeddings = self._normalize(self.encode([' '.join(s) for s in required_skills]))
+            similarity = job_embeddings @ candidate_embeddings.T
             
-            # Also check for direct skill matches
-            matched_skills = 0
-            for req_skill in job_description.required_skills:
-                for cand_skill in candidate.skills:
-                    if req_skill.lower() in cand_skill.lower() or cand_skill.lower() in req_skill.lower():
-                        matched_skills += 1
-                        break
+            # Also check for direct skill matches: matches[r, n] is whether
+            # required skill r matches any skill of candidate n
+            vocabulary = sorted({skill for skills in required_skills for skill in skills})
+            vocabulary_index = {skill: r for r, skill in enumerate(vocabulary)}
+            matches = np.zeros((len(vocabulary), len(candidates)), dtype=np.float32)
+            for r, req_skill in enumerate(vocabulary):
+                for n, skills in enumerate(candidate_skills):
+                    if any(req_skill in cand_skill or cand_skill in req_skill for cand_skill in skills):
+                        matches[r, n] = 1.0
             
-            direct_match_score = matched_skills / len(job_description.required_skills) if job_description.required_skills else 0
+            # requirements[k, r] counts how often job k lists skill r
+            requirements = np.zeros((len(job_descriptions), len(vocabulary)), dtype=np.float32)
+            for k, skills in enumerate(required_skills):
+                for skill in skills:
+                    requirements[k, vocabulary_index[skill]] += 1.0
+            required_counts = requirements.sum(axis=1, keepdims=True)
+            direct_match_score = (requirements @ matches) / np.maximum(required_counts, 1.0)
             
             # Combine similarity and direct matches
-            final_score = 0.6 * similarity + 0.4 * direct_match_score
-            return min(final_score, 1.0)
+            scores = np.minimum(0.6 * similarity + 0.4 * direct_match_score, 1.0)
+            
+            has_skills = np.array([bool(s) for s in candidate_skills])
+            has_requirements = np.array([bool(s) for s in required_skills])
+            return np.where(has_requirements[:, None] & has_skills[None, :], scores, 0.0)
             
         except Exception as e:
-            print(f"Error calculating skills match for {candidate.name}: {str(e)}")
-            return 0.0
+            print(f"Error calculating skills match: {str(e)}")
+            return scores
     
-    def _calculate_experience_relevance(self, candidate: Candidate, job_description: JobDescription) -> float:
+    def _calculate_experience_relevance(self, candidates: List[Candidate],
+                                        job_descriptions: List[JobDescription]) -> np.ndarray:
         """Calculate experience relevance score"""
         try:
             # Extract years from experience string
-            experience_years = self._extract_years_from_text(candidate.experience)
-            required_years = self._extract_years_from_text(job_description.experience_required)
+            experience_years = np.array(
+                [self._extract_years_from_text(c.experience) for c in candidates], dtype=np.float32
+            )[None, :]
+            required_years = np.array(
+                [self._extract_years_from_text(j.experience_required) for j in job_descriptions], dtype=np.float32
+            )[:, None]
             
-            if experience_years == 0:
-                return 0.3  # Some base score for unclear experience
+            # Bonus for more experience, but with diminishing returns (max 30%)
+            bonus = np.minimum((experience_years - required_years) * 0.05, 0.3)
+            # Penalty for less experience (max 60%)
+            penalty = np.minimum((required_years - experience_years) * 0.15, 0.6)
             
-            if required_years == 0:
-                return 0.7  # Default score when requirement is unclear
+            scores = np.where(
+                experience_years >= required_years,
+                np.minimum(1.0, 0.8 + bonus),
+                np.maximum(0.1, 0.8 - penalty)
+            )
+            scores = np.where(required_years == 0, 0.7, scores)  # Default score when requirement is unclear
+            scores = np.where(experience_years == 0, 0.3, scores)  # Some base score for unclear experience
+            return scores.astype(np.float32)
             
-            # Calculate score based on experience match
-            if experience_years >= required_years:
-                # Bonus for more experience, but with diminishing returns
-                excess_years = experience_years - required_years
-                bonus = min(excess_years * 0.05, 0.3)  # Max 30% bonus
-                return min(1.0, 0.8 + bonus)
-            else:
-                # Penalty for less experience
-                shortage = required_years - experience_years
-                penalty = min(shortage * 0.15, 0.6)  # Max 60% penalty
-                return max(0.1, 0.8 - penalty)
-                
         except Exception as e:
-            print(f"Error calculating experience relevance for {candidate.name}: {str(e)}")
-            return 0.5
+            print(f"Error calculating experience relevance: {str(e)}")
+            return np.full((len(job_descriptions), len(candidates)), 0.5, dtype=np.float32)
     
-    def _calculate_overall_fit(self, candidate: Candidate, job_description: JobDescription) -> float:
+    def _calculate_overall_fit(self, candidates: List[Candidate],
+                               job_descriptions: List[JobDescription]) -> np.ndarray:
         """Calculate overall fit using resume text and job description"""
         try:
+            if not candidates or not job_descriptions:
+                return np.zeros((len(job_descriptions), len(candidates)), dtype=np.float32)
+            
             # Use first 1000 characters of resume for efficiency
-            candidate_text = candidate.resume_text[:1000]
-            job_text = job_description.description
+            candidate_embeddings = self._normalize(self.encode([c.resume_text[:1000] for c in candidates]))
+            job_embeddings = self._normalize(self.encode([j.description for j in job_descriptions]))
+            return job_embeddings @ candidate_embeddings.T
             
-            similarity = self._get_text_similarity(candidate_text, job_text)
-            return similarity
+        except Exception as e:
+            print(f"Error calculating overall fit: {str(e)}")
+            return np.zeros((len(job_descriptions), len(candidates)), dtype=np.float32)
+    
+    def _calculate_chunked_overall_fit(self, candidates: List[Candidate],
+                                       job_descriptions: List[JobDescription]) -> np.ndarray:
+        """Calculate overall fit over the full resume text of every candidate.
+        
+        Resumes are split into sentence-aware chunks, all chunks of all
+        candidates are embedded in large batches, and the chunk similarities
+        are reduced per candidate with max or top-k mean.
+        """
+        scores = np.zeros((len(job_descriptions), len(candidates)), dtype=np.float32)
+        try:
+            chunks = []
+            owners = []
+            for index, candidate in enumerate(candidates):
+                candidate_chunks = self._split_into_chunks(candidate.resume_text)
+                chunks.extend(candidate_chunks)
+                owners.extend([index] * len(candidate_chunks))
+            
+            if not chunks or not job_descriptions:
+                return scores
+            
+            chunk_embeddings = self._normalize(self.encode(chunks))
+            job_embeddings = self._normalize(self.encode([j.description for j in job_descriptions]))
+            similarities = job_embeddings @ chunk_embeddings.T
+            
+            owners = np.asarray(owners)
+            has_chunks = np.bincount(owners, minlength=len(candidates)) > 0
+            scores[:, has_chunks] = self._aggregate_chunk_scores(similarities, owners)
+            return scores
             
         except Exception as e:
-            print(f"Error calculating overall fit for {candidate.name}: {str(e)}")
-            return 0.0
+            print(f"Error calculating chunked overall fit: {str(e)}")
+            return scores
+    
+    def _aggregate_chunk_scores(self, similarities: np.ndarray, owners: np.ndarray) -> np.ndarray:
+        """Reduce chunk similarities to one score per owner.
+        
+        ``similarities`` has shape (jobs, chunks) and ``owners`` must be
+        sorted (chunks of one candidate are contiguous). Returns a
+        (jobs, distinct owners) array, in owner order.
+        """
+        starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        
+        if self.chunk_aggregation == 'max' or self.chunk_top_k <= 1:
+            return np.maximum.reduceat(similarities, starts, axis=1)
+        
+        # Scatter into a padded (jobs x owners x max_chunks) array, then take
+        # the mean of the k largest entries along the last axis
+        lengths = np.diff(np.r_[starts, owners.shape[0]])
+        positions = np.arange(owners.shape[0]) - np.repeat(starts, lengths)
+        rows = np.repeat(np.arange(len(starts)), lengths)
+        padded = np.full((similarities.shape[0], len(starts), lengths.max()), -np.inf, dtype=np.float32)
+        padded[:, rows, positions] = similarities
+        
+        k = min(self.chunk_top_k, padded.shape[2])
+        top_k = -np.sort(-padded, axis=2)[:, :, :k]
+        counts = np.minimum(lengths, k)
+        return np.where(np.isfinite(top_k), top_k, 0.0).sum(axis=2) / counts
+    
+    def _split_into_chunks(self, text: str) -> List[str]:
+        """Split text into sentence-aware windows of at most chunk_max_chars"""
+        if not text:
+            return []
+        
+        sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+|\n+', text) if s.strip()]
+        
+        chunks = []
+        current = ""
+        for sentence in sentences:
+            # Hard-wrap sentences that are longer than a whole window
+            while len(sentence) > self.chunk_max_chars:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(sentence[:self.chunk_max_chars])
+                sentence = sentence[self.chunk_max_chars:]
+            
+            if current and len(current) + len(sentence) + 1 > self.chunk_max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in batches, reusing cached embeddings where possible"""
+        with self._embedding_cache_lock:
+            cached = {text: self._embedding_cache.get(text) for text in texts}
+            for text, embedding in cached.items():
+                if embedding is not None:
+                    self._embedding_cache.move_to_end(text)
+        
+        missing = [text for text, embedding in cached.items() if embedding is None]
+        if missing:
+            new_embeddings = self.embedding_model.encode(missing, batch_size=self.batch_size)
+            with self._embedding_cache_lock:
+                for text, embedding in zip(missing, new_embeddings):
+                    cached[text] = embedding
+                    self._embedding_cache[text] = embedding
+                while len(self._embedding_cache) > self.embedding_cache_size:
+                    self._embedding_cache.popitem(last=False)
+        
+        return np.asarray([cached[text] for text in texts])
+    
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
     
     def _get_text_similarity(self, text1: str, text2: str) -> float:
         """Get similarity between two texts using sentence transformers"""
         try:
-            embeddings = self.embedding_model.encode([text1, text2])
+            embeddings = self.encode([text1, text2])
             similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
             return float(similarity)
         except:
@@ -1,18 +1,26 @@
+import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict, Optional
 from datetime import datetime
 from backend.models.candidate import Candidate
+from backend.utils.async_io import gather_bounded
 from config.config import Config
 
 
 class EmailAgent:
-    def __init__(self):
+    def __init__(self, use_async: bool = Config.ASYNC_AGENTS):
         self.smtp_server = Config.SMTP_SERVER
         self.smtp_port = Config.SMTP_PORT
         self.email_address = Config.EMAIL_ADDRESS
         self.email_password = Config.EMAIL_PASSWORD
+        self.smtp_starttls = Config.SMTP_STARTTLS
+        # Sends all emails concurrently over aiosmtplib instead of one by one
+        self.use_async = use_async
+        self.max_concurrency = Config.ASYNC_MAX_CONCURRENCY
+        self.timeout = Config.ASYNC_REQUEST_TIMEOUT
+        self.total_timeout = Config.ASYNC_TOTAL_TIMEOUT
         
     def send_interview_confirmations(self, candidates: List[Candidate]) -> Dict[str, any]:
         """Send interview confirmation emails to selected candidates"""
@@ -20,13 +28,17 @@ class EmailAgent:
         sent_count = 0
         failed_sends = []
         
-        for candidate in candidates:
-            if candidate.interview_scheduled:
-                success = self._send_individual_confirmation(candidate)
-                if success:
-                    sent_count += 1
-                else:
-                    failed_sends.append(candidate.name)
+        scheduled = [c for c in candidates if c.interview_scheduled]
+        if self.use_async:
+            results = asyncio.run(self._send_confirmations_async(scheduled))
+        else:
+            results = [self._send_individual_confirmation(c) for c in scheduled]
+        
+        for candidate, success in zip(scheduled, results):
+            if success:
+                sent_count += 1
+            else:
+                failed_sends.append(candidate.name)
         
         return {
             'sent_count': sent_count,
@@ -34,25 +46,31 @@ class EmailAgent:
             'failed_sends': failed_sends
         }
     
+    def _build_message(self, candidate: Candidate) -> MIMEMultipart:
+        # Create email content
+        subject = f"Interview Confirmation - {candidate.name}"
+        body = self._generate_email_body(candidate)
+        
+        # Create email message
+        msg = MIMEMultipart()
+        msg['From'] = self.email_address
+        msg['To'] = candidate.email
+        msg['Subject'] = subject
+        
+        msg.attach(MIMEText(body, 'html'))
+        return msg
+    
     def _send_individual_confirmation(self, candidate: Candidate) -> bool:
         """Send confirmation email to individual candidate"""
         try:
-            # Create email content
-            subject = f"Interview Confirmation - {candidate.name}"
-            body = self._generate_email_body(candidate)
-            
-            # Create email message
-            msg = MIMEMultipart()
-            msg['From'] = self.email_address
-            msg['To'] = candidate.email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'html'))
+            msg = self._build_message(candidate)
             
             # Send email
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_address, self.email_password)
+                if self.smtp_starttls:
+                    server.starttls()
+                if self.email_password:
+                    server.login(self.email_address, self.email_password)
                 text = msg.as_string()
                 server.sendmail(self.email_address, candidate.email, text)
             
@@ -62,6 +80,33 @@ class EmailAgent:
             print(f"Error sending email to {candidate.email}: {str(e)}")
             return False
     
+    async def _send_confirmations_async(self, candidates: List[Candidate]) -> List[bool]:
+        """Send confirmation emails concurrently; one success flag per candidate"""
+        import aiosmtplib
+        
+        async def send(candidate: Candidate):
+            await aiosmtplib.send(
+                self._build_message(candidate),
+                sender=self.email_address,
+                recipients=[candidate.email],
+                hostname=self.smtp_server,
+                port=self.smtp_port,
+                start_tls=self.smtp_starttls,
+                username=self.email_address if self.email_password else None,
+                password=self.email_password or None,
+                timeout=self.timeout
+            )
+        
+        results = await gather_bounded(send, candidates, self.max_concurrency,
+                                       timeout=self.timeout, total_timeout=self.total_timeout)
+        
+        successes = []
+        for candidate, result in zip(candidates, results):
+            if isinstance(result, BaseException):
+                print(f"Error sending email to {candidate.email}: {result!r}")
+            successes.append(not isinstance(result, BaseException))
+        return successes
+    
     def _generate_email_body(self, candidate: Candidate) -> str:
         """Generate personalized email body for candidate"""
         
@@ -1,64 +1,134 @@
-from transformers import pipeline, AutoTokenizer, AutoModel
-from sentence_transformers import SentenceTransformer
-import torch
 from sklearn.metrics.pairwise import cosine_similarity
+import hashlib
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from backend.models.candidate import Candidate, JobDescription
 from backend.utils.pdf_parser import PDFParser
+from backend.utils.deduplication import CandidateDeduplicator
+from backend.utils.parse_cache import ParseCache
+from backend.utils.inference_client import get_embedding_model, get_summarizer
+from config.config import Config
 
 
 class ResumeProcessor:
-    def __init__(self):
-        self.embedding_model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
-        self.summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
+    def __init__(self, load_summarizer: bool = True):
+        # Local models, or thin clients of the inference server (Config.INFERENCE_SOCKET)
+        self.embedding_model = get_embedding_model()
+        self._summarizer = get_summarizer() if load_summarizer else None
         self.pdf_parser = PDFParser()
+        # Parsed resumes by PDF hash, so re-uploads skip parsing entirely
+        self.parse_cache = ParseCache(
+            Config.PARSE_CACHE_PATH, self.pdf_parser.version
+        ) if Config.PARSE_CACHE_PATH else None
+        self.deduplicator = CandidateDeduplicator(Config.DUPLICATE_TEXT_SIMILARITY)
+    
+    @property
+    def summarizer(self):
+        """The summarization model, loaded on first use if the constructor skipped it"""
+        if self._summarizer is None:
+            self._summarizer = get_summarizer()
+        return self._summarizer
+        
+    def process_resumes(self, resume_files: List[str], job_description: JobDescription,
+                        deduplicate: bool = True,
+                        content_hashes: Optional[Dict[str, str]] = None) -> List[Candidate]:
+        """Process multiple resume files and create candidate objects
         
-    def process_resumes(self, resume_files: List[str], job_description: JobDescription) -> List[Candidate]:
-        """Process multiple resume files and create candidate objects"""
+        Near-duplicate resumes (same email or nearly identical text) are
+        merged before summarization; the merged filenames are recorded on
+        the kept candidate's ``merged_files``. ``content_hashes`` maps files
+        to known PDF hashes, saving the re-hash for the parse cache lookup.
+        """
         candidates = []
+        content_hashes = content_hashes or {}
         
         for resume_file in resume_files:
-            try:
-                # Extract text from PDF
-                resume_text = self.pdf_parser.extract_text_from_pdf(resume_file)
-                if not resume_text:
-                    continue
-                
-                # Extract candidate information
-                contact_info = self.pdf_parser.extract_contact_info(resume_text)
-                name = self.pdf_parser.extract_name(resume_text)
-                skills = self.pdf_parser.extract_skills(resume_text)
-                experience = self.pdf_parser.extract_experience_years(resume_text)
-                
-                # Create candidate object
-                candidate = Candidate(
-                    name=name,
-                    email=contact_info.get('email', 'not_provided@email.com'),
-                    phone=contact_info.get('phone'),
-                    experience=experience,
-                    skills=skills,
-                    education="Extracted from resume",
-                    resume_text=resume_text,
-                    filename=resume_file
-                )
-                
-                # Generate candidate summary
-                candidate.summary = self._generate_candidate_summary(candidate, job_description)
-                
+            candidate = self.parse_resume(resume_file, content_hashes.get(resume_file))
+            if candidate:
                 candidates.append(candidate)
-                
-            except Exception as e:
-                print(f"Error processing {resume_file}: {str(e)}")
-                continue
+        
+        return self.finalize_candidates(candidates, job_description, deduplicate)
+    
+    def parse_resume(self, resume_file: str, content_hash: Optional[str] = None) -> Optional[Candidate]:
+        """Extract a candidate from one resume file (no model calls)"""
+        try:
+            if self.parse_cache is None:
+                return self.candidate_from_fields(resume_file, self.pdf_parser.parse_resume(resume_file))
+            
+            if content_hash is None:
+                content_hash = self._hash_file(resume_file)
+            fields = self.parse_cache.get(content_hash)
+            if fields is ParseCache.MISSING:
+                fields = self.pdf_parser.parse_resume(resume_file)
+                self.parse_cache.put(content_hash, fields)
+            
+            candidate = self.candidate_from_fields(resume_file, fields)
+            if candidate:
+                candidate.content_hash = content_hash
+            return candidate
+        except Exception as e:
+            print(f"Error processing {resume_file}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+    
+    def candidate_from_fields(self, resume_file: str, fields: Optional[Dict]) -> Optional[Candidate]:
+        """Create a candidate from the fields returned by PDFParser.parse_resume"""
+        if not fields:
+            return None
+        
+        contact_info = fields['contact_info']
+        return Candidate(
+            name=fields['name'],
+            email=contact_info.get('email', 'not_provided@email.com'),
+            phone=contact_info.get('phone'),
+            experience=fields['experience'],
+            skills=fields['skills'],
+            education="Extracted from resume",
+            resume_text=fields['text'],
+            filename=resume_file
+        )
+    
+    def finalize_candidates(self, candidates: List[Candidate], job_description: JobDescription,
+                            deduplicate: bool = True, summarize: bool = True) -> List[Candidate]:
+        """Merge near-duplicates and generate summaries for parsed candidates"""
+        if deduplicate:
+            candidates = self.deduplicator.deduplicate(candidates)
+        
+        # Generate candidate summaries (only for unique candidates)
+        if summarize and candidates:
+            self._generate_candidate_summaries(candidates, job_description)
         
         return candidates
     
-    def _generate_candidate_summary(self, candidate: Candidate, job_description: JobDescription) -> str:
-        """Generate AI-powered candidate summary"""
+    def _generate_candidate_summaries(self, candidates: List[Candidate], job_description: JobDescription):
+        """Summarize all candidates in one batched model call"""
         try:
-            # Create input text for summarization
-            input_text = f"""
+            summaries = self.summarizer(
+                [self._summary_input(candidate, job_description) for candidate in candidates],
+                max_length=150,
+                min_length=50,
+                do_sample=False,
+                batch_size=Config.SUMMARY_BATCH_SIZE
+            )
+            for candidate, summary in zip(candidates, summaries):
+                candidate.summary = summary['summary_text']
+        except Exception as e:
+            # Fall back to one call per candidate, so one bad input does not
+            # cost everyone their summary
+            print(f"Error generating batched summaries: {str(e)}")
+            for candidate in candidates:
+                candidate.summary = self._generate_candidate_summary(candidate, job_description)
+    
+    def _summary_input(self, candidate: Candidate, job_description: JobDescription) -> str:
+        """Create input text for summarization"""
+        return f"""
             Job Requirements: {job_description.description}
             Required Skills: {', '.join(job_description.required_skills)}
             
@@ -68,6 +138,11 @@ class ResumeProcessor:
             Skills: {', '.join(candidate.skills)}
             Resume Content: {candidate.resume_text[:1000]}...
             """
+    
+    def _generate_candidate_summary(self, candidate: Candidate, job_description: JobDescription) -> str:
+        """Generate AI-powered candidate summary"""
+        try:
+            input_text = self._summary_input(candidate, job_description)
             
             # Generate summary using BART
             summary = self.summarizer(
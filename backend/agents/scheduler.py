@@ -2,11 +2,27 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Dict
 from backend.models.candidate import Candidate
 from backend.utils.calendar_integration import GoogleCalendarIntegration
+from backend.utils.async_calendar import AsyncCalendarClient
+from backend.utils.scheduling_engine import Interviewer, SchedulingEngine
+from config.config import Config
 
 
 class InterviewScheduler:
-    def __init__(self):
+    def __init__(self, use_async: bool = Config.ASYNC_AGENTS):
         self.calendar_integration = GoogleCalendarIntegration()
+        # Creates all events concurrently instead of one request at a time
+        self.async_calendar = AsyncCalendarClient(
+            self.calendar_integration,
+            max_concurrency=Config.ASYNC_MAX_CONCURRENCY,
+            timeout=Config.ASYNC_REQUEST_TIMEOUT,
+            total_timeout=Config.ASYNC_TOTAL_TIMEOUT
+        ) if use_async else None
+
+    def _create_events(self, requests: List[Dict]) -> List[Optional[Dict]]:
+        """Create calendar events for create_interview_event keyword arguments"""
+        if self.async_calendar is not None:
+            return self.async_calendar.create_interview_events(requests)
+        return [self.calendar_integration.create_interview_event(**request) for request in requests]
 
     def _get_next_working_day(self, date: datetime) -> datetime:
         """Skip weekends and return next working day (Mon-Fri)."""
@@ -35,6 +51,7 @@ class InterviewScheduler:
         interview_slots = []
 
         slot_index = 0
+        interview_times = []
         for candidate in candidates:
             # Reset slots after 8 interviews, move to next working day
             if slot_index >= 8:
@@ -43,19 +60,23 @@ class InterviewScheduler:
                 slot_index = 0
 
             # Assign time slot (9 AM + slot_index hours)
-            interview_time = current_date.replace(
+            interview_times.append(current_date.replace(
                 hour=9 + slot_index, minute=0, second=0, microsecond=0
-            )
+            ))
             slot_index += 1
 
-            # Create calendar event
-            event_details = self.calendar_integration.create_interview_event(
-                candidate_name=candidate.name,
-                candidate_email=candidate.email,
-                start_time=interview_time,
-                duration_minutes=60
-            )
+        # Create calendar events
+        events = self._create_events([
+            {
+                "candidate_name": candidate.name,
+                "candidate_email": candidate.email,
+                "start_time": interview_time,
+                "duration_minutes": 60
+            }
+            for candidate, interview_time in zip(candidates, interview_times)
+        ])
 
+        for candidate, interview_time, event_details in zip(candidates, interview_times, events):
             if event_details:
                 candidate.interview_scheduled = True
                 candidate.interview_datetime = interview_time
@@ -76,6 +97,71 @@ class InterviewScheduler:
             "schedule_details": interview_slots
         }
 
+    def schedule_interviews_with_engine(
+        self,
+        candidates: List[Candidate],
+        interviewers: List[Interviewer],
+        start_date: Optional[datetime] = None,
+        days: int = 10,
+        slot_minutes: int = 60,
+        buffer_minutes: int = 15,
+        panel_size: int = 1
+    ) -> Dict[str, any]:
+        """
+        Schedule interviews around the interviewers' existing events:
+        - Highest overall_score candidates get the earliest slots.
+        - Each slot needs panel_size free interviewers plus buffers.
+        - Slots fall in the candidate's working hours in their time zone.
+        """
+        if start_date is None:
+            start_date = datetime.now() + timedelta(days=1)
+        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        engine = SchedulingEngine(
+            slot_minutes=slot_minutes,
+            buffer_minutes=buffer_minutes,
+            panel_size=panel_size
+        )
+        result = engine.schedule(candidates, interviewers, start_date, start_date + timedelta(days=days))
+
+        scheduled_count = 0
+        failed_schedules = [c.name for c in result.unscheduled]
+        interview_slots = []
+
+        events = self._create_events([
+            {
+                "candidate_name": assignment.candidate.name,
+                "candidate_email": assignment.candidate.email,
+                "start_time": assignment.start,
+                "duration_minutes": slot_minutes,
+                "interviewer_emails": assignment.interviewers
+            }
+            for assignment in result.assignments
+        ])
+
+        for assignment, event_details in zip(result.assignments, events):
+            candidate = assignment.candidate
+            if event_details:
+                candidate.interview_scheduled = True
+                candidate.interview_datetime = assignment.start
+                candidate.interview_link = event_details.get("meet_link")
+                scheduled_count += 1
+                interview_slots.append({
+                    "candidate": candidate.name,
+                    "datetime": assignment.start.strftime("%Y-%m-%d %H:%M UTC"),
+                    "interviewers": assignment.interviewers,
+                    "meet_link": candidate.interview_link
+                })
+            else:
+                failed_schedules.append(candidate.name)
+
+        return {
+            "scheduled_count": scheduled_count,
+            "total_candidates": len(candidates),
+            "failed_schedules": failed_schedules,
+            "schedule_details": interview_slots
+        }
+
     def get_interview_summary(self, candidates: List[Candidate]) -> Dict[str, any]:
         """Return a summary of scheduled interviews."""
         scheduled_interviews = [c for c in candidates if getattr(c, "interview_scheduled", False)]
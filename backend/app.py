@@ -1,14 +1,23 @@
 from flask import Flask, request, jsonify, render_template
+import hashlib
 import os
 from werkzeug.utils import secure_filename
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from backend.agents.resume_processor import ResumeProcessor
 from backend.agents.candidate_ranker import CandidateRanker
 from backend.agents.scheduler import InterviewScheduler
 from backend.agents.email_agent import EmailAgent
-from backend.models.candidate import JobDescription
+from backend.models.candidate import Candidate, JobDescription
+from backend.utils.upload_store import UploadStore
+from backend.utils.ingestion import ResumeIngestionPool
+from backend.utils.archive_import import ArchiveImporter
+from backend.utils.streaming_upload import StreamingUploadManager, UnsupportedFileTypeError
+from backend.utils.inference_executor import InferenceExecutor
+from backend.utils.scheduling_engine import Interviewer
+from backend.utils.ranking_stats import score_statistics
 from config.config import Config
 
 #flask part
@@ -25,12 +34,24 @@ resume_processor = ResumeProcessor()
 candidate_ranker = CandidateRanker()
 scheduler = InterviewScheduler()
 email_agent = EmailAgent()
+upload_store = UploadStore(Config.UPLOAD_FOLDER)
+ingestion_pool = ResumeIngestionPool(Config.PARSE_WORKERS, resume_processor.parse_cache)
+archive_importer = ArchiveImporter(
+    ingestion_pool, Config.ARCHIVE_BATCH_SIZE, Config.ARCHIVE_MAX_MEMBER_SIZE
+)
+streaming_uploads = StreamingUploadManager(
+    upload_store, ingestion_pool, archive_importer, Config.UPLOAD_SESSION_TTL
+)
+# Model calls run here, off the request threads
+inference = InferenceExecutor(Config.INFERENCE_THREADS, Config.TORCH_THREADS)
 
-
+# Per-process state: gunicorn.conf.py runs a single worker because of it
 current_job_description: Optional[JobDescription] = None
 processed_candidates: List = []
 ranked_candidates: List = []
 selected_candidates: List = []
+# candidate_id -> Candidate for the current ranking
+candidate_index: Dict[str, Candidate] = {}
 
 # Ensure that the upload folder is presnt
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -42,6 +63,146 @@ def index():
     return render_template('index.html')
 
 
+def _job_description_from_data(job_data: Dict) -> JobDescription:
+    """Build a JobDescription from submitted form or JSON fields"""
+    required_skills = job_data.get('required_skills', '')
+    if isinstance(required_skills, str):
+        required_skills = required_skills.split(',')
+    return JobDescription(
+        title=job_data.get('job_title', ''),
+        description=job_data.get('job_description', ''),
+        required_skills=[s.strip() for s in required_skills if s.strip()],
+        experience_required=job_data.get('experience_required', ''),
+        qualifications=job_data.get('qualifications', '')
+    )
+
+
+def _is_count(value) -> bool:
+    """True for a non-negative JSON integer (booleans excluded)"""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _is_string_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _index_candidates():
+    """Give every ranked candidate a stable id and rebuild candidate_index.
+    
+    Ids come from the resume's content hash, so they survive re-ranking and
+    appends; candidates without one are hashed from their file and text.
+    """
+    global candidate_index
+    index = {}
+    for candidate in ranked_candidates:
+        if not candidate.candidate_id:
+            source = candidate.content_hash or hashlib.sha256(
+                f"{candidate.filename}\0{candidate.resume_text}".encode('utf-8')
+            ).hexdigest()
+            candidate_id = source[:16]
+            suffix = 1
+            while candidate_id in index and index[candidate_id] is not candidate:
+                suffix += 1
+                candidate_id = f"{source[:16]}-{suffix}"
+            candidate.candidate_id = candidate_id
+        index[candidate.candidate_id] = candidate
+    candidate_index = index
+
+
+def _candidate_row(candidate: Candidate, rank: int) -> Dict:
+    return {
+        'id': candidate.candidate_id,
+        'rank': rank,
+        'name': candidate.name,
+        'email': candidate.email,
+        'phone': getattr(candidate, "phone", None) or 'Not provided',
+        'experience': getattr(candidate, "experience", ''),
+        'skills': getattr(candidate, "skills", []),
+        'skill_match_score': round(float(candidate.skill_match_score) * 100, 2),
+        'experience_score': round(float(candidate.experience_score) * 100, 2),
+        'overall_score': round(float(candidate.overall_score) * 100, 2),
+        'summary': getattr(candidate, "summary", ''),
+        'filename': os.path.basename(getattr(candidate, "filename", "")),
+        'merged_files': [os.path.basename(f) for f in getattr(candidate, "merged_files", [])]
+    }
+
+
+def _candidates_response(skipped_duplicates: List[str], **extra):
+    """Build the ranked-candidates JSON response for the current job.
+    
+    With a ``page_size`` query parameter only the first page of rows is
+    included; the rest is fetched from /api/candidates.
+    """
+    _index_candidates()
+    page_size = request.args.get('page_size', type=int)
+    page = ranked_candidates if page_size is None else ranked_candidates[:page_size]
+    candidates_data = [_candidate_row(candidate, rank) for rank, candidate in enumerate(page, start=1)]
+    
+    merged_duplicates = [
+        {
+            'kept': os.path.basename(c.filename),
+            'merged': [os.path.basename(f) for f in c.merged_files]
+        }
+        for c in ranked_candidates if c.merged_files
+    ]
+    
+    return jsonify({
+        'success': True,
+        'message': f'Processed {len(ranked_candidates)} candidates',
+        'candidates': candidates_data,
+        'total_candidates': len(ranked_candidates),
+        'job_title': current_job_description.title,
+        'skipped_duplicates': skipped_duplicates,
+        'merged_duplicates': merged_duplicates,
+        **extra
+    })
+
+
+def _save_uploaded_resumes(uploaded_files) -> Tuple[List[str], Dict[str, str], List[str]]:
+    """Store multipart PDF uploads; returns (paths, path -> content hash, skipped)"""
+    resume_paths = []
+    content_hashes = {}
+    skipped_duplicates = []
+    
+    for file in uploaded_files:
+        if file and file.filename.lower().endswith('.pdf'):
+            # Content-addressed storage; identical PDFs are skipped
+            file_path, content_hash, _ = upload_store.save(file)
+            if file_path in content_hashes:
+                skipped_duplicates.append(file.filename)
+                continue
+            resume_paths.append(file_path)
+            content_hashes[file_path] = content_hash
+    
+    return resume_paths, content_hashes, skipped_duplicates
+
+
+def _collect_streamed_candidates(upload_id: str) -> Tuple[List, List[str], List[Dict]]:
+    """Build candidates from a finished streaming upload session and close it.
+    
+    Returns (candidates, skipped duplicate files, archive import errors).
+    """
+    session = streaming_uploads.get_session(upload_id)
+    candidates = []
+    for file_path, content_hash, future in streaming_uploads.collect(upload_id):
+        try:
+            candidate = resume_processor.candidate_from_fields(file_path, future.result())
+        except Exception as e:
+            print(f"Error processing {file_path}: {str(e)}")
+            continue
+        if candidate:
+            candidate.content_hash = content_hash
+            candidates.append(candidate)
+    skipped_duplicates = list(session.skipped_duplicates)
+    import_errors = [
+        {'archive': archive['archive'], **error}
+        for archive in streaming_uploads.get_progress(upload_id)['archives']
+        for error in archive['errors']
+    ]
+    streaming_uploads.close_session(upload_id)
+    return candidates, skipped_duplicates, import_errors
+
+
 @app.route('/api/process_job', methods=['POST'])
 def process_job():
     """Process job description and uploaded resumes"""
@@ -49,97 +210,407 @@ def process_job():
     
     try:
         # description data
-        job_data = request.form.to_dict()
+        current_job_description = _job_description_from_data(request.form.to_dict())
         
+        resume_paths, content_hashes, skipped_duplicates = _save_uploaded_resumes(
+            request.files.getlist('resumes')
+        )
+        
+        if not resume_paths:
+            return jsonify({'error': 'No valid PDF files uploaded'}), 400
+        
+        # Processing  resumes
+        processed_candidates = inference.run(
+            resume_processor.process_resumes, resume_paths, current_job_description,
+            content_hashes=content_hashes
+        )
+        for candidate in processed_candidates:
+            candidate.content_hash = content_hashes.get(candidate.filename, '')
         
-        current_job_description = JobDescription(
-            title=job_data.get('job_title', ''),
-            description=job_data.get('job_description', ''),
-            required_skills=[s.strip() for s in job_data.get('required_skills', '').split(',') if s.strip()],
-            experience_required=job_data.get('experience_required', ''),
-            qualifications=job_data.get('qualifications', '')
+        # Rank candidates accordingly
+        ranked_candidates = inference.run(
+            candidate_ranker.rank_candidates, processed_candidates, current_job_description
         )
         
+        return _candidates_response(skipped_duplicates)
         
-        uploaded_files = request.files.getlist('resumes')
-        resume_paths = []
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/uploads', methods=['POST'])
+def create_upload():
+    """Open a streaming upload session for a batch of resumes"""
+    return jsonify({
+        'success': True,
+        'upload_id': streaming_uploads.create_session(),
+        'chunk_size': Config.UPLOAD_CHUNK_SIZE
+    })
+
+
+@app.route('/api/uploads/<upload_id>/files/<filename>', methods=['GET'])
+def get_upload_offset(upload_id, filename):
+    """Return how many bytes of a file have been received (for resuming)"""
+    try:
+        return jsonify({'offset': streaming_uploads.get_offset(upload_id, filename)})
+    except KeyError as e:
+        return jsonify({'error': str(e)}), 404
+    except UnsupportedFileTypeError as e:
+        return jsonify({'error': str(e)}), 415
+
+
+@app.route('/api/uploads/<upload_id>/files/<filename>', methods=['PUT'])
+def upload_chunk(upload_id, filename):
+    """Append a raw chunk to a file; ?offset=N&final=1 on the last chunk"""
+    try:
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        offset = -1
+    if offset < 0:
+        return jsonify({'error': 'offset must be a non-negative integer'}), 400
+    final = request.args.get('final') in ('1', 'true')
+    
+    try:
+        result = streaming_uploads.write_chunk(upload_id, filename, request.stream, offset, final)
+        return jsonify({'success': True, **result})
+    except KeyError as e:
+        return jsonify({'error': str(e)}), 404
+    except UnsupportedFileTypeError as e:
+        return jsonify({'error': str(e)}), 415
+    except ValueError as e:
+        # Offset mismatch: the client resumes from get_upload_offset
+        return jsonify({'error': str(e)}), 409
+
+
+@app.route('/api/uploads/<upload_id>/progress', methods=['GET'])
+def get_upload_progress(upload_id):
+    """Report completed files and per-member progress of archive imports"""
+    try:
+        return jsonify(streaming_uploads.get_progress(upload_id))
+    except KeyError as e:
+        return jsonify({'error': str(e)}), 404
+
+
+@app.route('/api/uploads/<upload_id>/process', methods=['POST'])
+def process_upload(upload_id):
+    """Rank the resumes of a streaming upload session against a job"""
+    global current_job_description, processed_candidates, ranked_candidates
+    
+    try:
+        job_data = request.get_json(silent=True) or request.form.to_dict()
+        current_job_description = _job_description_from_data(job_data)
         
-        for file in uploaded_files:
-            if file and file.filename.lower().endswith('.pdf'):
-                filename = secure_filename(file.filename)
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(file_path)
-                resume_paths.append(file_path)
+        candidates, skipped_duplicates, import_errors = _collect_streamed_candidates(upload_id)
         
-        if not resume_paths:
+        if not candidates:
             return jsonify({'error': 'No valid PDF files uploaded'}), 400
         
-        # Processing  resumes
-        processed_candidates = resume_processor.process_resumes(
-            resume_paths, current_job_description
+        processed_candidates = inference.run(
+            resume_processor.finalize_candidates, candidates, current_job_description
+        )
+        ranked_candidates = inference.run(
+            candidate_ranker.rank_candidates, processed_candidates, current_job_description
         )
         
-        # Rank candidates accordingly
-        ranked_candidates = candidate_ranker.rank_candidates(
-            processed_candidates, current_job_description
+        return _candidates_response(skipped_duplicates, import_errors=import_errors)
+        
+    except KeyError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/append_resumes', methods=['POST'])
+def append_resumes():
+    """Add late applications to the current job without re-processing the rest.
+    
+    Accepts multipart 'resumes' files or JSON/form 'upload_id' of a finished
+    streaming upload. Only the new resumes are parsed, summarized and
+    scored; they are merged into the existing ranking in score order.
+    """
+    global processed_candidates, ranked_candidates
+    
+    try:
+        if current_job_description is None:
+            return jsonify({'error': 'No job has been processed yet'}), 400
+        
+        data = request.get_json(silent=True) or request.form.to_dict()
+        import_errors = []
+        if data.get('upload_id'):
+            candidates, skipped_duplicates, import_errors = _collect_streamed_candidates(data['upload_id'])
+        else:
+            resume_paths, content_hashes, skipped_duplicates = _save_uploaded_resumes(
+                request.files.getlist('resumes')
+            )
+            candidates = []
+            for resume_path in resume_paths:
+                candidate = resume_processor.parse_resume(resume_path, content_hashes[resume_path])
+                if candidate:
+                    candidate.content_hash = content_hashes[resume_path]
+                    candidates.append(candidate)
+        
+        # Resumes already in the pool are skipped outright
+        known_hashes = {c.content_hash for c in processed_candidates if c.content_hash}
+        new_candidates = []
+        for candidate in candidates:
+            if candidate.content_hash in known_hashes:
+                skipped_duplicates.append(os.path.basename(candidate.filename))
+            else:
+                new_candidates.append(candidate)
+        
+        # Near-duplicates of existing candidates are merged into them
+        new_candidates = resume_processor.deduplicator.deduplicate_against(
+            processed_candidates, new_candidates
         )
+        new_candidates = inference.run(
+            resume_processor.finalize_candidates, new_candidates, current_job_description, deduplicate=False
+        )
+        
+        new_ranked = inference.run(candidate_ranker.rank_candidates, new_candidates, current_job_description)
+        ranked_candidates = candidate_ranker.merge_ranked(ranked_candidates, new_ranked)
+        processed_candidates = processed_candidates + new_candidates
+        
+        return _candidates_response(
+            skipped_duplicates,
+            import_errors=import_errors,
+            appended_count=len(new_candidates)
+        )
+        
+    except KeyError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/rank_jobs', methods=['POST'])
+def rank_jobs():
+    """Rank the processed candidate pool against several jobs at once.
+    
+    Expects JSON {"jobs": [{job_title, job_description, required_skills,
+    experience_required, qualifications}, ...], "top_n": optional}. Scores
+    are returned per job; the current job's ranking is left untouched.
+    """
+    try:
+        if not processed_candidates:
+            return jsonify({'error': 'No processed candidates'}), 400
         
-        # Prepare response data
-        candidates_data = []
-        for candidate in ranked_candidates:
-            candidates_data.append({
-                'name': candidate.name,
-                'email': candidate.email,
-                'phone': getattr(candidate, "phone", None) or 'Not provided',
-                'experience': getattr(candidate, "experience", ''),
-                'skills': getattr(candidate, "skills", []),
-                'skill_match_score': round(float(candidate.skill_match_score) * 100, 2),
-                'experience_score': round(float(candidate.experience_score) * 100, 2),
-                'overall_score': round(float(candidate.overall_score) * 100, 2),
-                'summary': getattr(candidate, "summary", ''),
-                'filename': os.path.basename(getattr(candidate, "filename", ""))
+        data = request.get_json() or {}
+        jobs = data.get('jobs')
+        if not jobs or not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+            return jsonify({'error': 'jobs must be a non-empty list of job objects'}), 400
+        top_n = data.get('top_n')
+        if top_n is not None and not _is_count(top_n):
+            return jsonify({'error': 'top_n must be a non-negative integer'}), 400
+        job_descriptions = [_job_description_from_data(job) for job in jobs]
+        
+        rankings = inference.run(candidate_ranker.rank_candidates_multi, processed_candidates, job_descriptions)
+        
+        jobs_data = []
+        for job, ranking in zip(job_descriptions, rankings):
+            if top_n is not None:
+                ranking = ranking[:top_n]
+            jobs_data.append({
+                'job_title': job.title,
+                'candidates': [
+                    {
+                        'name': score.candidate.name,
+                        'email': score.candidate.email,
+                        'filename': os.path.basename(score.candidate.filename),
+                        'skill_match_score': round(score.skill_match_score * 100, 2),
+                        'experience_score': round(score.experience_score * 100, 2),
+                        'overall_score': round(score.overall_score * 100, 2)
+                    }
+                    for score in ranking
+                ]
             })
         
         return jsonify({
             'success': True,
-            'message': f'Processed {len(candidates_data)} candidates',
-            'candidates': candidates_data,
-            'job_title': current_job_description.title
+            'message': f'Ranked {len(processed_candidates)} candidates for {len(jobs_data)} jobs',
+            'jobs': jobs_data
         })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/candidates', methods=['GET'])
+def get_candidates():
+    """One page of the current ranking: ?offset=0&limit=50"""
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+    page = ranked_candidates[offset:offset + limit]
+    return jsonify({
+        'total': len(ranked_candidates),
+        'offset': offset,
+        'candidates': [
+            _candidate_row(candidate, rank)
+            for rank, candidate in enumerate(page, start=offset + 1)
+        ]
+    })
+
+
+@app.route('/api/candidates/stats', methods=['GET'])
+def get_candidate_stats():
+    """Score histograms and skill counts over the whole ranking: ?bins=10&top_skills=20"""
+    bins = min(max(request.args.get('bins', 10, type=int), 1), 100)
+    top_skills = min(max(request.args.get('top_skills', 20, type=int), 1), 200)
+    return jsonify(score_statistics(ranked_candidates, bins, top_skills))
+
+
 @app.route('/api/select_candidates', methods=['POST'])
 def select_candidates():
-    """Select top candidates for interview"""
+    """Select candidates for interview by id, by rule, or (legacy) by name.
+    
+    JSON fields, combined as a union:
+    - candidate_ids: list of ids from the ranking response
+    - top_n: the N highest-ranked candidates
+    - min_score: everyone with overall_score >= min_score (percent, 0-100)
+    - selected_candidates: names or {id, name} objects (older clients)
+    - exclude_ids: ids removed from the result (e.g. top_n = all, minus a few)
+    """
     global selected_candidates
     
     try:
         data = request.get_json() or {}
-        selected_names = data.get('selected_candidates', [])
+        for field in ('candidate_ids', 'exclude_ids'):
+            if not _is_string_list(data.get(field, [])):
+                return jsonify({'error': f'{field} must be a list of candidate id strings'}), 400
+        legacy = data.get('selected_candidates', [])
+        if not isinstance(legacy, list) or not all(isinstance(entry, (str, dict)) for entry in legacy):
+            return jsonify({'error': 'selected_candidates must be a list of names or {id, name} objects'}), 400
         
-       
-        if selected_names and isinstance(selected_names[0], dict):
-            selected_names = [c.get('name') for c in selected_names if c.get('name')]
+        selected_ids = []
+        unknown_ids = []
+        for candidate_id in data.get('candidate_ids', []):
+            if candidate_id in candidate_index:
+                selected_ids.append(candidate_id)
+            else:
+                unknown_ids.append(candidate_id)
         
-        # Get selected candidates from ranked list
-        selected_candidates = [
-            candidate for candidate in ranked_candidates 
-            if candidate.name in selected_names
-        ]
+        top_n = data.get('top_n')
+        if top_n is not None and not _is_count(top_n):
+            return jsonify({'error': 'top_n must be a non-negative integer'}), 400
+        min_score = data.get('min_score')
+        if min_score is not None and (isinstance(min_score, bool) or not isinstance(min_score, (int, float))
+                                      or not 0 <= min_score <= 100):
+            return jsonify({'error': 'min_score must be a number between 0 and 100'}), 400
+        
+        # ranked_candidates is sorted by score, so rules are prefixes of it
+        if top_n is not None:
+            selected_ids.extend(c.candidate_id for c in ranked_candidates[:top_n])
+        if min_score is not None:
+            threshold = min_score / 100
+            for candidate in ranked_candidates:
+                if candidate.overall_score < threshold:
+                    break
+                selected_ids.append(candidate.candidate_id)
+        
+        if legacy:
+            ids_by_name = {}
+            for candidate in ranked_candidates:
+                ids_by_name.setdefault(candidate.name, []).append(candidate.candidate_id)
+            for entry in legacy:
+                if isinstance(entry, dict):
+                    if entry.get('id') in candidate_index:
+                        selected_ids.append(entry['id'])
+                        continue
+                    entry = entry.get('name')
+                selected_ids.extend(ids_by_name.get(entry, []))
+        
+        # Drop repeats, keeping the order the ids were picked in
+        excluded = set(data.get('exclude_ids', []))
+        selected_ids = [i for i in dict.fromkeys(selected_ids) if i not in excluded]
+        selected_candidates = [candidate_index[candidate_id] for candidate_id in selected_ids]
         
         return jsonify({
             'success': True,
             'message': f'Selected {len(selected_candidates)} candidates for interview',
-            'selected_count': len(selected_candidates)
+            'selected_count': len(selected_candidates),
+            'selected_ids': selected_ids,
+            'unknown_ids': unknown_ids
         })
         
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _valid_timezone(name) -> bool:
+    try:
+        ZoneInfo(name)
+        return True
+    except (ZoneInfoNotFoundError, TypeError, ValueError):
+        return False
+
+
+def _interviewers_from_data(interviewers_data: List[Dict], start_date: datetime,
+                            days: int) -> List[Interviewer]:
+    """Build Interviewers from JSON: {email, timezone, busy: [[start, end], ...]}.
+    
+    Without 'busy', the interviewer's calendar is read from the local mirror.
+    Raises ValueError listing every entry without an email, with an unknown
+    time zone or with unreadable busy times or working hours.
+    """
+    interviewers = []
+    errors = []
+    for position, entry in enumerate(interviewers_data, start=1):
+        email = entry.get('email') if isinstance(entry, dict) else None
+        if not isinstance(email, str) or not email.strip():
+            errors.append(f"entry {position} has no email")
+            continue
+        timezone = entry.get('timezone', 'UTC')
+        if not _valid_timezone(timezone):
+            errors.append(f"{email}: unknown time zone {timezone!r}")
+            continue
+        try:
+            busy = [
+                (datetime.fromisoformat(start), datetime.fromisoformat(end))
+                for start, end in entry['busy']
+            ] if 'busy' in entry else None
+            work_start_hour = int(entry.get('work_start_hour', 9))
+            work_end_hour = int(entry.get('work_end_hour', 17))
+        except (TypeError, ValueError) as e:
+            errors.append(f"{email}: {str(e)}")
+            continue
+        
+        if busy is None:
+            busy = scheduler.calendar_integration.get_busy_intervals(
+                email, start_date, start_date + timedelta(days=days + 1)
+            )
+        interviewers.append(Interviewer(
+            email=email,
+            busy=busy,
+            timezone=timezone,
+            work_start_hour=work_start_hour,
+            work_end_hour=work_end_hour
+        ))
+    
+    if errors:
+        raise ValueError(f"Invalid interviewers: {'; '.join(errors)}")
+    return interviewers
+
+
+def _apply_candidate_timezones(candidates: List[Candidate], data: Dict):
+    """Set Candidate.timezone from candidate_timezones ({candidate_id: zone})
+    or the candidate_timezone default; candidates keep earlier values otherwise"""
+    default = data.get('candidate_timezone')
+    by_id = data.get('candidate_timezones') or {}
+    if not isinstance(by_id, dict):
+        raise ValueError("candidate_timezones must map candidate ids to time zones")
+    
+    zones = list(by_id.values()) + ([default] if default is not None else [])
+    invalid = [zone for zone in zones if not _valid_timezone(zone)]
+    if invalid:
+        raise ValueError(f"Unknown time zones: {', '.join(map(repr, invalid))}")
+    
+    for candidate in candidates:
+        timezone = by_id.get(candidate.candidate_id) or default
+        if timezone:
+            candidate.timezone = timezone
+
+
 @app.route('/api/schedule_interviews', methods=['POST'])
 def schedule_interviews():
     """Schedule interviews for selected candidates based on HR's chosen start date."""
@@ -160,11 +631,36 @@ def schedule_interviews():
         except ValueError:
             return jsonify({'error': 'Invalid date format'}), 400
         
-        # Schedule interviews
-        scheduling_result = scheduler.schedule_interviews(
-            selected_candidates,
-            start_date=start_date
-        )
+        # Schedule interviews; with interviewer calendars, use the
+        # constraint-based engine instead of fixed 9-5 slots
+        if data.get('interviewers'):
+            try:
+                days = int(data.get('days', 10))
+                slot_minutes = int(data.get('slot_minutes', 60))
+                buffer_minutes = int(data.get('buffer_minutes', 15))
+                panel_size = int(data.get('panel_size', 1))
+                if days <= 0 or slot_minutes <= 0 or buffer_minutes < 0 or panel_size < 1:
+                    raise ValueError("days and slot_minutes must be positive, buffer_minutes "
+                                     "non-negative and panel_size at least 1")
+                interviewers = _interviewers_from_data(data['interviewers'], start_date, days)
+                _apply_candidate_timezones(selected_candidates, data)
+            except (TypeError, ValueError) as e:
+                return jsonify({'error': str(e)}), 400
+            
+            scheduling_result = scheduler.schedule_interviews_with_engine(
+                selected_candidates,
+                interviewers,
+                start_date=start_date,
+                days=days,
+                slot_minutes=slot_minutes,
+                buffer_minutes=buffer_minutes,
+                panel_size=panel_size
+            )
+        else:
+            scheduling_result = scheduler.schedule_interviews(
+                selected_candidates,
+                start_date=start_date
+            )
         
       
         interview_summary = scheduler.get_interview_summary(selected_candidates)
@@ -216,4 +712,5 @@ def get_status():
 
 if __name__ == '__main__':
     # Note: app still serves templates from ../frontend/templates and static from ../frontend/static
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # The reloader would import this module (and load every model) twice
+    app.run(debug=Config.DEBUG, use_reloader=False, host='0.0.0.0', port=5000)
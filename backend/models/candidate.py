@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -19,7 +19,13 @@ class Candidate:
     overall_score: float = 0.0
     summary: str = ""
     
+    # Deduplication attributes
+    content_hash: str = ""
+    candidate_id: str = ""  # stable id, derived from content_hash
+    merged_files: List[str] = field(default_factory=list)
+    
     # Interview attributes
+    timezone: Optional[str] = None  # IANA name, e.g. "Asia/Kolkata", from the scheduling request; None = UTC
     interview_scheduled: bool = False
     interview_datetime: Optional[datetime] = None
     interview_link: Optional[str] = None
@@ -30,4 +36,13 @@ class JobDescription:
     description: str
     required_skills: List[str]
     experience_required: str
-    qualifications: str
\ No newline at end of file
+    qualifications: str
+
+@dataclass
+class CandidateScore:
+    """Scores of one candidate for one job, kept apart from the shared Candidate"""
+    candidate: Candidate
+    skill_match_score: float
+    experience_score: float
+    overall_fit_score: float
+    overall_score: float
\ No newline at end of file
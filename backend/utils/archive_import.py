@@ -0,0 +1,169 @@
+import hashlib
+import os
+import tarfile
+import zipfile
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from backend.utils.ingestion import ResumeIngestionPool
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+
+def is_archive(filename: str) -> bool:
+    return filename.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+@dataclass
+class ArchiveImportProgress:
+    archive: str
+    # Unknown for streamed tar archives until the end is reached
+    total_members: Optional[int] = None
+    processed: int = 0
+    parsed: int = 0
+    duplicates: int = 0
+    errors: List[Dict[str, str]] = field(default_factory=list)
+    done: bool = False
+    
+    def to_dict(self) -> Dict:
+        return {
+            'archive': self.archive,
+            'total_members': self.total_members,
+            'processed': self.processed,
+            'parsed': self.parsed,
+            'duplicates': self.duplicates,
+            'failed': len(self.errors),
+            'errors': self.errors,
+            'done': self.done
+        }
+
+
+class ArchiveImporter:
+    """Import resume PDFs from ZIP and tar archives without extracting them.
+    
+    Members are read one at a time straight from the archive and sent to the
+    ingestion pool in batches of ``batch_size``; the next batch is only read
+    once the current one has been parsed, so memory stays bounded by
+    ``batch_size * max_member_size`` however large the archive is. Members
+    that are not PDFs, too large, unreadable or without text are recorded as
+    per-member errors instead of failing the import.
+    """
+    
+    def __init__(self, ingestion_pool: ResumeIngestionPool, batch_size: int = 32,
+                 max_member_size: int = 16 * 1024 * 1024):
+        self.ingestion_pool = ingestion_pool
+        self.batch_size = batch_size
+        self.max_member_size = max_member_size
+    
+    def import_archive(self,
+                       archive_path: str,
+                       on_batch: Callable[[List[Tuple[str, str, Dict]]], None],
+                       progress: Optional[ArchiveImportProgress] = None,
+                       seen_hashes: Optional[set] = None) -> ArchiveImportProgress:
+        """Parse every PDF member and pass results to ``on_batch``.
+        
+        ``on_batch`` receives a list of (member_name, content_hash, fields)
+        after each batch; ``fields`` is the PDFParser.parse_resume dict.
+        Members whose content hash is already in ``seen_hashes`` are skipped.
+        """
+        archive_name = os.path.basename(archive_path)
+        if progress is None:
+            progress = ArchiveImportProgress(archive=archive_name)
+        if seen_hashes is None:
+            seen_hashes = set()
+        
+        try:
+            batch = []
+            for member_name, data, error in self._iter_members(archive_path, progress):
+                if error:
+                    progress.processed += 1
+                    progress.errors.append({'member': member_name, 'error': error})
+                    continue
+                
+                content_hash = hashlib.sha256(data).hexdigest()
+                if content_hash in seen_hashes:
+                    progress.processed += 1
+                    progress.duplicates += 1
+                    continue
+                seen_hashes.add(content_hash)
+                
+                batch.append((member_name, content_hash, self.ingestion_pool.submit_bytes(data, content_hash)))
+                if len(batch) >= self.batch_size:
+                    self._finish_batch(archive_name, batch, on_batch, progress)
+                    batch = []
+            
+            if batch:
+                self._finish_batch(archive_name, batch, on_batch, progress)
+        except (zipfile.BadZipFile, tarfile.TarError, OSError) as e:
+            progress.errors.append({'member': archive_name, 'error': f"Unreadable archive: {str(e)}"})
+        finally:
+            progress.done = True
+        
+        return progress
+    
+    def _finish_batch(self, archive_name: str, batch: List[Tuple], on_batch: Callable,
+                      progress: ArchiveImportProgress):
+        results = []
+        for member_name, content_hash, future in batch:
+            progress.processed += 1
+            try:
+                fields = future.result()
+            except Exception as e:
+                progress.errors.append({'member': member_name, 'error': str(e)})
+                continue
+            if not fields:
+                progress.errors.append({'member': member_name, 'error': 'No text could be extracted'})
+                continue
+            progress.parsed += 1
+            results.append((f"{archive_name}:{member_name}", content_hash, fields))
+        
+        if results:
+            on_batch(results)
+    
+    def _iter_members(self, archive_path: str,
+                      progress: ArchiveImportProgress) -> Iterator[Tuple[str, Optional[bytes], Optional[str]]]:
+        """Yield (member_name, data, error) for each file member"""
+        if zipfile.is_zipfile(archive_path):
+            yield from self._iter_zip_members(archive_path, progress)
+        else:
+            yield from self._iter_tar_members(archive_path, progress)
+    
+    def _iter_zip_members(self, archive_path: str, progress: ArchiveImportProgress):
+        with zipfile.ZipFile(archive_path) as archive:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            progress.total_members = len(members)
+            for info in members:
+                error = self._check_member(info.filename, info.file_size)
+                if error:
+                    yield info.filename, None, error
+                    continue
+                try:
+                    with archive.open(info) as member:
+                        yield info.filename, member.read(), None
+                except (zipfile.BadZipFile, RuntimeError, OSError) as e:
+                    yield info.filename, None, str(e)
+    
+    def _iter_tar_members(self, archive_path: str, progress: ArchiveImportProgress):
+        # Stream mode reads the archive sequentially, without an index
+        with tarfile.open(archive_path, mode='r|*') as archive:
+            count = 0
+            for info in archive:
+                if not info.isfile():
+                    continue
+                count += 1
+                error = self._check_member(info.name, info.size)
+                if error:
+                    yield info.name, None, error
+                    continue
+                member = archive.extractfile(info)
+                if member is None:
+                    yield info.name, None, 'Unreadable member'
+                    continue
+                yield info.name, member.read(), None
+            progress.total_members = count
+    
+    def _check_member(self, name: str, size: int) -> Optional[str]:
+        if not name.lower().endswith('.pdf'):
+            return 'Not a PDF file'
+        if size > self.max_member_size:
+            return f"File too large ({size} bytes)"
+        return None
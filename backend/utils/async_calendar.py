@@ -0,0 +1,76 @@
+import asyncio
+from typing import Dict, List, Optional
+from backend.utils.async_io import gather_bounded
+from backend.utils.calendar_integration import GoogleCalendarIntegration
+
+
+class AsyncCalendarClient:
+    """Creates many interview events concurrently over aiohttp.
+    
+    Uses the same event bodies, credentials and local mirror as
+    GoogleCalendarIntegration, but sends the insert requests with at most
+    ``max_concurrency`` in flight instead of one after another. ``api_url``
+    can point at a local stand-in for the Calendar API.
+    """
+    
+    API_URL = 'https://www.googleapis.com/calendar/v3'
+    
+    def __init__(self,
+                 calendar_integration: GoogleCalendarIntegration,
+                 max_concurrency: int = 10,
+                 timeout: float = 30,
+                 total_timeout: Optional[float] = None,
+                 api_url: str = API_URL):
+        self.calendar_integration = calendar_integration
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.total_timeout = total_timeout
+        self.api_url = api_url.rstrip('/')
+    
+    def create_interview_events(self, requests: List[Dict]) -> List[Optional[Dict]]:
+        """Blocking wrapper around create_interview_events_async"""
+        return asyncio.run(self.create_interview_events_async(requests))
+    
+    async def create_interview_events_async(self, requests: List[Dict]) -> List[Optional[Dict]]:
+        """Create one event per request (create_interview_event keyword arguments).
+        
+        Returns event details like create_interview_event, or None for each
+        request that failed or timed out.
+        """
+        import aiohttp
+        
+        if not requests:
+            return []
+        try:
+            token = await asyncio.to_thread(self.calendar_integration.get_access_token)
+        except Exception as e:
+            print(f"Error creating calendar events: {str(e)}")
+            return [None] * len(requests)
+        
+        headers = {'Authorization': f'Bearer {token}'}
+        async with aiohttp.ClientSession(headers=headers) as session:
+            results = await gather_bounded(
+                lambda request: self._insert_event(session, request),
+                requests,
+                self.max_concurrency,
+                timeout=self.timeout,
+                total_timeout=self.total_timeout
+            )
+        
+        details = []
+        for request, result in zip(requests, results):
+            if isinstance(result, BaseException):
+                print(f"Error creating calendar event for {request['candidate_name']}: {result!r}")
+                details.append(None)
+            else:
+                details.append(self.calendar_integration.record_created_event(result))
+        return details
+    
+    async def _insert_event(self, session, request: Dict) -> Dict:
+        body = GoogleCalendarIntegration.build_interview_event(**request)
+        async with session.post(f"{self.api_url}/calendars/primary/events",
+                                params={'conferenceDataVersion': '1'},
+                                json=body) as response:
+            if response.status >= 400:
+                raise RuntimeError(f"HTTP {response.status}: {await response.text()}")
+            return await response.json()
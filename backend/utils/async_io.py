@@ -0,0 +1,45 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+
+async def gather_bounded(fn: Callable[[Any], Awaitable[Any]],
+                         items: Sequence[Any],
+                         max_concurrency: int,
+                         timeout: Optional[float] = None,
+                         total_timeout: Optional[float] = None) -> List[Any]:
+    """Run ``fn(item)`` for every item with at most max_concurrency in flight.
+    
+    Returns one entry per item, in order: the result, or the exception it
+    raised. Each call is limited to ``timeout`` seconds; calls still running
+    after ``total_timeout`` are cancelled and reported as TimeoutError. If
+    the caller is cancelled, all calls are cancelled with it.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run(item):
+        async with semaphore:
+            return await asyncio.wait_for(fn(item), timeout)
+    
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    if not tasks:
+        return []
+    
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=total_timeout)
+    except asyncio.CancelledError:
+        pending = tasks
+        raise
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    
+    results = []
+    for task in tasks:
+        if task.cancelled():
+            results.append(asyncio.TimeoutError(f"Cancelled after {total_timeout} seconds"))
+        elif task.exception() is not None:
+            results.append(task.exception())
+        else:
+            results.append(task.result())
+    return results
@@ -0,0 +1,161 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_seconds(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int((dt - _EPOCH).total_seconds())
+
+
+def _from_seconds(seconds: int) -> datetime:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+
+def _event_time(value: Dict) -> int:
+    """Seconds since the epoch for an event start/end ({dateTime} or all-day {date})"""
+    if 'dateTime' in value:
+        return _to_seconds(datetime.fromisoformat(value['dateTime'].replace('Z', '+00:00')))
+    return _to_seconds(datetime.fromisoformat(value['date']))
+
+
+class CalendarMirror:
+    """Local SQLite mirror of Google Calendar events for free/busy queries.
+    
+    ``sync`` pulls only what changed since the last call using the Calendar
+    API's sync tokens (falling back to a full sync when the token expires),
+    and ``busy``/``is_free`` answer from an indexed local table instead of
+    listing events from the API on every scheduling pass.
+    
+    The mirror works with any object shaped like the Google API client
+    (``service.events().list(**params).execute()``), so a local stand-in
+    can be passed to ``sync`` in place of the real service.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The SQLite connection, opened on first use and again after a fork"""
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._pid = os.getpid()
+            with self._conn:
+                self._conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS events (
+                        calendar_id TEXT NOT NULL,
+                        event_id TEXT NOT NULL,
+                        start_ts INTEGER NOT NULL,
+                        end_ts INTEGER NOT NULL,
+                        summary TEXT,
+                        PRIMARY KEY (calendar_id, event_id)
+                    );
+                    CREATE INDEX IF NOT EXISTS events_by_time ON events (calendar_id, start_ts, end_ts);
+                    CREATE TABLE IF NOT EXISTS sync_state (
+                        calendar_id TEXT PRIMARY KEY,
+                        sync_token TEXT,
+                        synced_at INTEGER
+                    );
+                """)
+        return self._conn
+    
+    def sync(self, service, calendar_id: str = 'primary') -> int:
+        """Bring the mirror of one calendar up to date; returns events changed"""
+        sync_token = self.get_sync_token(calendar_id)
+        try:
+            items, next_sync_token = self._list_changes(service, calendar_id, sync_token)
+        except Exception as e:
+            # 410 Gone: the sync token expired, start again with a full sync
+            if sync_token is None or getattr(getattr(e, 'resp', None), 'status', None) != 410:
+                raise
+            sync_token = None
+            items, next_sync_token = self._list_changes(service, calendar_id, None)
+        
+        with self._lock, self.conn:
+            if sync_token is None:
+                self.conn.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+            self._apply(calendar_id, items)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (calendar_id, sync_token, synced_at) VALUES (?, ?, ?)",
+                (calendar_id, next_sync_token, _to_seconds(datetime.now(timezone.utc)))
+            )
+        return len(items)
+    
+    def apply_events(self, calendar_id: str, events: Iterable[Dict]):
+        """Record events known locally (e.g. just created) before the next sync"""
+        with self._lock, self.conn:
+            self._apply(calendar_id, list(events))
+    
+    def busy(self, calendar_id: str, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """Busy intervals overlapping [start, end), sorted by start (UTC)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT start_ts, end_ts FROM events "
+                "WHERE calendar_id = ? AND start_ts < ? AND end_ts > ? ORDER BY start_ts",
+                (calendar_id, _to_seconds(end), _to_seconds(start))
+            ).fetchall()
+        return [(_from_seconds(s), _from_seconds(e)) for s, e in rows]
+    
+    def is_free(self, calendar_id: str, start: datetime, end: datetime) -> bool:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM events WHERE calendar_id = ? AND start_ts < ? AND end_ts > ? LIMIT 1",
+                (calendar_id, _to_seconds(end), _to_seconds(start))
+            ).fetchone()
+        return row is None
+    
+    def get_sync_token(self, calendar_id: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT sync_token FROM sync_state WHERE calendar_id = ?", (calendar_id,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _list_changes(self, service, calendar_id: str,
+                      sync_token: Optional[str]) -> Tuple[List[Dict], Optional[str]]:
+        """All pages of events.list; a full listing when sync_token is None"""
+        params = {'calendarId': calendar_id, 'singleEvents': True, 'maxResults': 2500}
+        if sync_token:
+            params['syncToken'] = sync_token
+        
+        items = []
+        page_token = None
+        while True:
+            if page_token:
+                params['pageToken'] = page_token
+            response = service.events().list(**params).execute()
+            items.extend(response.get('items', []))
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return items, response.get('nextSyncToken')
+    
+    def _apply(self, calendar_id: str, items: List[Dict]):
+        """Upsert busy events and drop cancelled or free (transparent) ones"""
+        deleted = []
+        rows = []
+        for item in items:
+            busy = (item.get('status') != 'cancelled'
+                    and item.get('transparency') != 'transparent'
+                    and 'start' in item and 'end' in item)
+            if not busy:
+                deleted.append((calendar_id, item['id']))
+                continue
+            rows.append((calendar_id, item['id'], _event_time(item['start']),
+                         _event_time(item['end']), item.get('summary')))
+        self.conn.executemany("DELETE FROM events WHERE calendar_id = ? AND event_id = ?", deleted)
+        self.conn.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)", rows)
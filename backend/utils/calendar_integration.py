@@ -1,75 +1,155 @@
-import pickle
 import os.path
+import tempfile
+import threading
 from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+from backend.utils.calendar_cache import CalendarMirror
+
+
+class CalendarNotAuthorizedError(RuntimeError):
+    pass
 
 
 class GoogleCalendarIntegration:
+    """Google Calendar client with lazy, non-interactive authentication.
+    
+    Nothing touches the network or the token file until the calendar is
+    first used, and serving code never opens a browser: without a usable
+    token, calls fail with CalendarNotAuthorizedError (and the agents report
+    the interview as not scheduled). Run ``authorize_calendar.py`` once to
+    create the token interactively.
+    
+    Credentials are loaded once and refreshed by a background timer shortly
+    before they expire. The API client is built once per thread, since the
+    underlying httplib2 connection is not thread-safe.
+    """
+    
     SCOPES = ['https://www.googleapis.com/auth/calendar']
+    REFRESH_MARGIN = timedelta(minutes=5)
+    REFRESH_RETRY_SECONDS = 60
     
-    def __init__(self, credentials_file='credentials.json', token_file='token.json'):
+    def __init__(self, credentials_file='credentials.json', token_file='token.json',
+                 cache_file='calendar_cache.sqlite3'):
         self.credentials_file = credentials_file
         self.token_file = token_file
-        self.service = None
-        self._authenticate()
+        # Local copy of calendar events, kept current with incremental syncs
+        self.mirror = CalendarMirror(cache_file)
+        self._lock = threading.Lock()
+        self._credentials = None
+        self._refresh_timer = None
+        self._local = threading.local()
     
-    def _authenticate(self):
-        """Authenticate with Google Calendar API"""
-        creds = None
-        
-        # Load existing token
-        if os.path.exists(self.token_file):
-            with open(self.token_file, 'rb') as token:
-                creds = pickle.load(token)
-        
-        # If no valid credentials, get new ones
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.credentials_file, self.SCOPES)
-                creds = flow.run_local_server(port=0)
-            
-            # Save credentials for next run
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(creds, token)
-        
-        self.service = build('calendar', 'v3', credentials=creds)
+    @property
+    def service(self):
+        """This thread's Calendar API client, authenticating on first use"""
+        credentials = self._get_credentials()
+        local = self._local
+        if getattr(local, 'service', None) is None or local.credentials is not credentials:
+            local.service = build('calendar', 'v3', credentials=credentials, cache_discovery=False)
+            local.credentials = credentials
+        return local.service
+    
+    def authorize(self):
+        """Run the interactive OAuth flow (opens a browser) and save the token"""
+        flow = InstalledAppFlow.from_client_secrets_file(self.credentials_file, self.SCOPES)
+        credentials = flow.run_local_server(port=0)
+        with self._lock:
+            self._save_credentials(credentials)
+            self._credentials = credentials
+            self._schedule_refresh(credentials)
+    
+    def _get_credentials(self) -> Credentials:
+        with self._lock:
+            credentials = self._credentials
+            if credentials is None:
+                credentials = self._load_credentials()
+            if credentials is None:
+                raise CalendarNotAuthorizedError(
+                    f"No usable Google Calendar token in {self.token_file}; run authorize_calendar.py"
+                )
+            # The background refresh may not have run (e.g. in a forked worker)
+            if not credentials.valid or self._expires_soon(credentials):
+                self._refresh(credentials)
+            if self._credentials is not credentials:
+                self._credentials = credentials
+                self._schedule_refresh(credentials)
+            return credentials
+    
+    def _load_credentials(self) -> Optional[Credentials]:
+        if not os.path.exists(self.token_file):
+            return None
+        try:
+            return Credentials.from_authorized_user_file(self.token_file, self.SCOPES)
+        except ValueError as e:
+            # e.g. a token pickled by an older version; re-run authorize_calendar.py
+            print(f"Ignoring unreadable calendar token {self.token_file}: {str(e)}")
+            return None
+    
+    def _save_credentials(self, credentials: Credentials):
+        # A unique temporary file in the same directory, so concurrent saves
+        # never share one and os.replace stays atomic; mkstemp also keeps the
+        # token readable by the owner only
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.token_file)), suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w') as token:
+                token.write(credentials.to_json())
+            os.replace(temp_path, self.token_file)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def _refresh(self, credentials: Credentials):
+        if not credentials.refresh_token:
+            raise CalendarNotAuthorizedError("Calendar token expired and cannot be refreshed")
+        credentials.refresh(Request())
+        self._save_credentials(credentials)
+    
+    def _expires_soon(self, credentials: Credentials) -> bool:
+        return credentials.expiry is not None and credentials.expiry - datetime.utcnow() < self.REFRESH_MARGIN
+    
+    def _schedule_refresh(self, credentials: Credentials):
+        """Refresh the token in a daemon thread shortly before it expires"""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        if credentials.expiry is None:
+            return
+        delay = (credentials.expiry - datetime.utcnow() - self.REFRESH_MARGIN).total_seconds()
+        self._refresh_timer = threading.Timer(max(delay, 0), self._background_refresh, args=(credentials,))
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _background_refresh(self, credentials: Credentials):
+        with self._lock:
+            if self._credentials is not credentials:
+                return
+            try:
+                self._refresh(credentials)
+                self._schedule_refresh(credentials)
+            except Exception as e:
+                print(f"Error refreshing calendar token: {str(e)}")
+                self._refresh_timer = threading.Timer(
+                    self.REFRESH_RETRY_SECONDS, self._background_refresh, args=(credentials,)
+                )
+                self._refresh_timer.daemon = True
+                self._refresh_timer.start()
     
     def create_interview_event(self, 
                              candidate_name: str,
                              candidate_email: str,
                              start_time: datetime,
-                             duration_minutes: int = 60) -> Optional[Dict]:
+                             duration_minutes: int = 60,
+                             interviewer_emails: Optional[List[str]] = None) -> Optional[Dict]:
         """Create a calendar event for interview"""
         try:
-            end_time = start_time + timedelta(minutes=duration_minutes)
-            
-            event = {
-                'summary': f'Interview with {candidate_name}',
-                'description': f'Job interview with candidate {candidate_name}',
-                'start': {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'attendees': [
-                    {'email': candidate_email},
-                ],
-                'conferenceData': {
-                    'createRequest': {
-                        'requestId': f"interview_{candidate_name}_{int(start_time.timestamp())}",
-                        'conferenceSolutionKey': {'type': 'hangoutsMeet'}
-                    }
-                }
-            }
+            event = self.build_interview_event(
+                candidate_name, candidate_email, start_time, duration_minutes, interviewer_emails
+            )
             
             event = self.service.events().insert(
                 calendarId='primary', 
@@ -77,32 +157,83 @@ class GoogleCalendarIntegration:
                 conferenceDataVersion=1
             ).execute()
             
-            return {
-                'event_id': event['id'],
-                'html_link': event['htmlLink'],
-                'meet_link': event.get('conferenceData', {}).get('entryPoints', [{}])[0].get('uri')
-            }
+            return self.record_created_event(event)
             
         except Exception as e:
             print(f"Error creating calendar event: {str(e)}")
             return None
     
+    @staticmethod
+    def build_interview_event(candidate_name: str,
+                              candidate_email: str,
+                              start_time: datetime,
+                              duration_minutes: int = 60,
+                              interviewer_emails: Optional[List[str]] = None) -> Dict:
+        """Request body for an interview event with a Google Meet link"""
+        end_time = start_time + timedelta(minutes=duration_minutes)
+        
+        return {
+            'summary': f'Interview with {candidate_name}',
+            'description': f'Job interview with candidate {candidate_name}',
+            'start': {
+                'dateTime': start_time.isoformat(),
+                'timeZone': 'UTC',
+            },
+            'end': {
+                'dateTime': end_time.isoformat(),
+                'timeZone': 'UTC',
+            },
+            'attendees': [
+                {'email': candidate_email},
+            ] + [{'email': email} for email in (interviewer_emails or [])],
+            'conferenceData': {
+                'createRequest': {
+                    'requestId': f"interview_{candidate_name}_{int(start_time.timestamp())}",
+                    'conferenceSolutionKey': {'type': 'hangoutsMeet'}
+                }
+            }
+        }
+    
+    def record_created_event(self, event: Dict) -> Dict:
+        """Add a created event to the local mirror and return its details"""
+        self.mirror.apply_events('primary', [event])
+        
+        return {
+            'event_id': event['id'],
+            'html_link': event['htmlLink'],
+            'meet_link': event.get('conferenceData', {}).get('entryPoints', [{}])[0].get('uri')
+        }
+    
+    def get_access_token(self) -> str:
+        """A current OAuth access token, for clients outside the Google library"""
+        return self._get_credentials().token
+    
+    def sync_calendar(self, calendar_id: str = 'primary') -> bool:
+        """Pull changes since the last sync into the local mirror"""
+        try:
+            self.mirror.sync(self.service, calendar_id)
+            return True
+        except Exception as e:
+            print(f"Error syncing calendar {calendar_id}: {str(e)}")
+            return False
+    
+    def get_busy_intervals(self,
+                           calendar_id: str,
+                           start: datetime,
+                           end: datetime) -> List[Tuple[datetime, datetime]]:
+        """Busy intervals of a calendar (e.g. an interviewer's email) in [start, end).
+        
+        Answered from the local mirror after an incremental sync; if the sync
+        fails, the last synced state is used.
+        """
+        self.sync_calendar(calendar_id)
+        return self.mirror.busy(calendar_id, start, end)
+    
     def get_available_slots(self, days_ahead: int = 7) -> List[datetime]:
         """Get available time slots for interviews"""
         try:
             now = datetime.utcnow()
-            end_date = now + timedelta(days=days_ahead)
-            
-            # Get busy times
-            events_result = self.service.events().list(
-                calendarId='primary',
-                timeMin=now.isoformat() + 'Z',
-                timeMax=end_date.isoformat() + 'Z',
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
+            self.sync_calendar('primary')
             
             # Generate available slots (9 AM to 5 PM, weekdays only)
             available_slots = []
@@ -114,21 +245,7 @@ class GoogleCalendarIntegration:
                         slot_start = current_date.replace(hour=hour)
                         slot_end = slot_start + timedelta(hours=1)
                         
-                        # Check if slot is free
-                        is_free = True
-                        for event in events:
-                            event_start = datetime.fromisoformat(
-                                event['start'].get('dateTime', event['start'].get('date'))
-                            )
-                            event_end = datetime.fromisoformat(
-                                event['end'].get('dateTime', event['end'].get('date'))
-                            )
-                            
-                            if (slot_start < event_end and slot_end > event_start):
-                                is_free = False
-                                break
-                        
-                        if is_free:
+                        if self.mirror.is_free('primary', slot_start, slot_end):
                             available_slots.append(slot_start)
                 
                 current_date += timedelta(days=1)
@@ -137,4 +254,4 @@ class GoogleCalendarIntegration:
             
         except Exception as e:
             print(f"Error getting available slots: {str(e)}")
-            return []
\ No newline at end of file
+            return []
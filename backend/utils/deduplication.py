@@ -0,0 +1,172 @@
+from typing import Dict, Iterator, List, Tuple
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+from backend.models.candidate import Candidate
+
+
+class CandidateDeduplicator:
+    """Merge candidates that are the same person before the expensive stages.
+    
+    Two candidates are duplicates when they share a real email address or
+    when their resume texts are nearly identical (TF-IDF cosine similarity
+    at or above ``text_similarity_threshold``). The first candidate of each
+    group is kept and the filenames of the others are recorded on its
+    ``merged_files``.
+    """
+    
+    PLACEHOLDER_EMAILS = {'not_provided@email.com'}
+    # Similarity matrix cells computed at once (rows per block x columns)
+    SIMILARITY_BLOCK_CELLS = 4_000_000
+    
+    def __init__(self, text_similarity_threshold: float = 0.95):
+        self.text_similarity_threshold = text_similarity_threshold
+    
+    def deduplicate(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Return the unique candidates, in their original order"""
+        if len(candidates) < 2:
+            return candidates
+        
+        parent = list(range(len(candidates)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        def union(i: int, j: int):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # Keep the earliest candidate as the group representative
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        # Same email address
+        first_by_email: Dict[str, int] = {}
+        for index, candidate in enumerate(candidates):
+            email = self._email_key(candidate)
+            if not email:
+                continue
+            if email in first_by_email:
+                union(first_by_email[email], index)
+            else:
+                first_by_email[email] = index
+        
+        # Near-identical resume text
+        try:
+            texts = [candidate.resume_text or '' for candidate in candidates]
+            tfidf = TfidfVectorizer().fit_transform(texts)
+            for i, j in self._similar_pairs(tfidf, tfidf):
+                if i < j:
+                    union(i, j)
+        except ValueError:
+            # Empty vocabulary (e.g. all texts blank); rely on email only
+            pass
+        
+        unique = []
+        for index, candidate in enumerate(candidates):
+            root = find(index)
+            if root == index:
+                unique.append(candidate)
+            else:
+                candidates[root].merged_files.append(candidate.filename)
+        
+        return unique
+    
+    def deduplicate_against(self, existing: List[Candidate], new: List[Candidate]) -> List[Candidate]:
+        """Return the new candidates that are not duplicates of each other or
+        of an existing candidate; merged files are recorded on the kept one.
+        
+        Only new-vs-existing and new-vs-new pairs are compared, so the cost
+        grows with ``len(new)`` rather than with the whole pool, and existing
+        candidates (already unique) are never merged with each other. A group
+        of new duplicates that matches several existing candidates is merged
+        into the earliest of them.
+        """
+        if not new:
+            return new
+        
+        parent = list(range(len(new)))
+        # Index of the earliest existing candidate each new one duplicates
+        existing_match: Dict[int, int] = {}
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        def union(i: int, j: int):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        def match(i: int, existing_index: int):
+            existing_match[i] = min(existing_index, existing_match.get(i, existing_index))
+        
+        # Same email address
+        existing_by_email: Dict[str, int] = {}
+        for index, candidate in enumerate(existing):
+            email = self._email_key(candidate)
+            if email:
+                existing_by_email.setdefault(email, index)
+        first_by_email: Dict[str, int] = {}
+        for index, candidate in enumerate(new):
+            email = self._email_key(candidate)
+            if not email:
+                continue
+            if email in existing_by_email:
+                match(index, existing_by_email[email])
+            elif email in first_by_email:
+                union(first_by_email[email], index)
+            else:
+                first_by_email[email] = index
+        
+        # Near-identical resume text: new rows against every pool column
+        try:
+            texts = [candidate.resume_text or '' for candidate in list(existing) + list(new)]
+            tfidf = TfidfVectorizer().fit_transform(texts)
+            for i, j in self._similar_pairs(tfidf[len(existing):], tfidf):
+                if j < len(existing):
+                    match(i, j)
+                elif j - len(existing) != i:
+                    union(i, j - len(existing))
+        except ValueError:
+            # Empty vocabulary (e.g. all texts blank); rely on email only
+            pass
+        
+        # A group is merged into an existing candidate if any member matched one
+        group_match: Dict[int, int] = {}
+        for index, existing_index in existing_match.items():
+            root = find(index)
+            group_match[root] = min(existing_index, group_match.get(root, existing_index))
+        
+        unique = []
+        for index, candidate in enumerate(new):
+            root = find(index)
+            if root in group_match:
+                existing[group_match[root]].merged_files.append(candidate.filename)
+            elif root == index:
+                unique.append(candidate)
+            else:
+                new[root].merged_files.append(candidate.filename)
+        
+        return unique
+    
+    def _similar_pairs(self, rows, columns) -> Iterator[Tuple[int, int]]:
+        """(row, column) pairs with similarity at or above the threshold.
+        
+        Computed one block of rows at a time, so memory stays bounded by
+        SIMILARITY_BLOCK_CELLS instead of growing with rows x columns.
+        """
+        block_rows = max(1, self.SIMILARITY_BLOCK_CELLS // max(columns.shape[0], 1))
+        for start in range(0, rows.shape[0], block_rows):
+            similarity = cosine_similarity(rows[start:start + block_rows], columns)
+            block_i, block_j = np.nonzero(similarity >= self.text_similarity_threshold)
+            for i, j in zip(block_i.tolist(), block_j.tolist()):
+                yield start + i, j
+    
+    def _email_key(self, candidate: Candidate) -> str:
+        """Normalized email, or '' for missing and placeholder addresses"""
+        email = (candidate.email or '').strip().lower()
+        return '' if email in self.PLACEHOLDER_EMAILS else email
@@ -0,0 +1,101 @@
+import threading
+from multiprocessing.connection import Client
+from typing import Any, Dict, List, Union
+
+import numpy as np
+from config.config import Config
+
+
+class InferenceClient:
+    """Connection to the local inference server (one connection per thread)"""
+    
+    def __init__(self, socket_path: str, authkey: bytes):
+        self.socket_path = socket_path
+        self.authkey = authkey
+        self._local = threading.local()
+    
+    def call(self, message: Dict) -> Any:
+        # Retry once on a fresh connection, e.g. after a server restart
+        for attempt in range(2):
+            connection = self._get_connection()
+            try:
+                connection.send(message)
+                response = connection.recv()
+                break
+            except (EOFError, OSError):
+                self._local.connection = None
+                if attempt:
+                    raise
+        
+        if isinstance(response, dict) and 'error' in response:
+            raise RuntimeError(f"Inference server error: {response['error']}")
+        return response
+    
+    def _get_connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = Client(self.socket_path, family='AF_UNIX', authkey=self.authkey)
+            self._local.connection = connection
+        return connection
+
+
+class RemoteEmbeddingModel:
+    """Drop-in for SentenceTransformer.encode backed by the inference server"""
+    
+    def __init__(self, client: InferenceClient):
+        self.client = client
+    
+    def encode(self, texts: Union[str, List[str]], batch_size: int = None, **kwargs) -> np.ndarray:
+        single = isinstance(texts, str)
+        embeddings = self.client.call({'op': 'encode', 'texts': [texts] if single else list(texts)})
+        return embeddings[0] if single else embeddings
+
+
+class RemoteSummarizer:
+    """Drop-in for the transformers summarization pipeline"""
+    
+    def __init__(self, client: InferenceClient):
+        self.client = client
+    
+    def __call__(self, texts: Union[str, List[str]], batch_size: int = None, **kwargs) -> List[Dict]:
+        single = isinstance(texts, str)
+        return self.client.call({
+            'op': 'summarize',
+            'texts': [texts] if single else list(texts),
+            'kwargs': kwargs
+        })
+
+
+_local_models: Dict[str, Any] = {}
+_local_models_lock = threading.Lock()
+_client = None
+
+
+def _get_client() -> InferenceClient:
+    global _client
+    if _client is None:
+        _client = InferenceClient(Config.INFERENCE_SOCKET, Config.SECRET_KEY.encode())
+    return _client
+
+
+def get_embedding_model():
+    """The embedding model: a thin client when Config.INFERENCE_SOCKET is set,
+    otherwise one local SentenceTransformer shared by all agents"""
+    if Config.INFERENCE_SOCKET:
+        return RemoteEmbeddingModel(_get_client())
+    with _local_models_lock:
+        if 'embedding' not in _local_models:
+            from sentence_transformers import SentenceTransformer
+            _local_models['embedding'] = SentenceTransformer(Config.EMBEDDING_MODEL)
+        return _local_models['embedding']
+
+
+def get_summarizer():
+    """The summarization pipeline, remote or local like get_embedding_model"""
+    if Config.INFERENCE_SOCKET:
+        return RemoteSummarizer(_get_client())
+    with _local_models_lock:
+        if 'summarizer' not in _local_models:
+            from transformers import pipeline
+            _local_models['summarizer'] = pipeline("summarization", model=Config.SUMMARIZATION_MODEL)
+        return _local_models['summarizer']
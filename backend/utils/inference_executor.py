@@ -0,0 +1,43 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class InferenceExecutor:
+    """Bounded thread pool for CPU-heavy model calls.
+    
+    Request threads hand embedding, summarization and ranking work to this
+    pool instead of running it themselves, so at most ``max_workers`` model
+    calls run at once per process (torch already parallelizes each call)
+    and the remaining request threads stay free for cheap requests such as
+    status polls, uploads and selection.
+    """
+    
+    def __init__(self, max_workers: int = 1, torch_threads: Optional[int] = None):
+        self.max_workers = max_workers
+        self.torch_threads = torch_threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def run(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs):
+        """Run fn(*args, **kwargs) on the inference pool and wait for the result"""
+        return self.submit(fn, *args, **kwargs).result(timeout=timeout)
+    
+    def submit(self, fn: Callable, *args, **kwargs):
+        return self._get_executor().submit(fn, *args, **kwargs)
+    
+    def configure_torch(self):
+        """Limit torch intra-op threads (call once per worker process)"""
+        if self.torch_threads:
+            import torch
+            torch.set_num_threads(self.torch_threads)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created lazily so no threads exist before a pre-fork server forks
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='inference'
+                )
+            return self._executor
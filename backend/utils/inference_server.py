@@ -0,0 +1,149 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.connection import Listener
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+
+class MicroBatcher:
+    """Collect requests from many callers and run them as one model call.
+    
+    The first request starts a batch; further requests join it until either
+    ``max_batch_size`` items are queued or ``max_wait_ms`` has passed. Items
+    are grouped by ``key`` (e.g. summarization settings), each group is run
+    through ``fn`` in one call, and the results are split back per request.
+    """
+    
+    def __init__(self, fn: Callable[[List[Any], Any], List[Any]], max_batch_size: int = 64,
+                 max_wait_ms: float = 10.0, name: str = 'batcher'):
+        self.fn = fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Tuple[List[Any], Any, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    
+    def submit(self, items: List[Any], key: Any = None) -> Future:
+        future = Future()
+        if not items:
+            future.set_result([])
+        else:
+            self._queue.put((list(items), key, future))
+        return future
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            size = len(batch[0][0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request[0])
+            
+            groups: Dict[Any, List[Tuple[List[Any], Future]]] = {}
+            for items, key, future in batch:
+                groups.setdefault(key, []).append((items, future))
+            for key, requests in groups.items():
+                self._run_group(key, requests)
+    
+    def _run_group(self, key: Any, requests: List[Tuple[List[Any], Future]]):
+        all_items = [item for items, _ in requests for item in items]
+        try:
+            results = self.fn(all_items, key)
+        except Exception as e:
+            for _, future in requests:
+                future.set_exception(e)
+            return
+        
+        offset = 0
+        for items, future in requests:
+            future.set_result(results[offset:offset + len(items)])
+            offset += len(items)
+
+
+class InferenceServer:
+    """Local inference process shared by all web workers.
+    
+    Listens on a Unix socket; every connection is served by its own thread,
+    and embedding and summarization requests from all connections are
+    micro-batched together before they reach the models.
+    
+    Messages are dicts: {'op': 'encode', 'texts': [...]} returns an array
+    of embeddings, {'op': 'summarize', 'texts': [...], 'kwargs': {...}}
+    returns a list of {'summary_text': ...} dicts. Errors come back as
+    {'error': message}.
+    """
+    
+    def __init__(self, socket_path: str, embedding_model, summarizer, authkey: bytes,
+                 max_batch_size: int = 64, max_wait_ms: float = 10.0, summary_batch_size: int = 8,
+                 embedding_batch_size: int = 64):
+        self.socket_path = socket_path
+        self.embedding_model = embedding_model
+        self.summarizer = summarizer
+        self.authkey = authkey
+        self.summary_batch_size = summary_batch_size
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_batcher = MicroBatcher(
+            self._encode_batch, max_batch_size, max_wait_ms, name='embedding-batcher'
+        )
+        self.summary_batcher = MicroBatcher(
+            self._summarize_batch, max_batch_size, max_wait_ms, name='summary-batcher'
+        )
+    
+    def serve_forever(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        with Listener(self.socket_path, family='AF_UNIX', authkey=self.authkey) as listener:
+            os.chmod(self.socket_path, 0o600)
+            print(f"Inference server listening on {self.socket_path}")
+            while True:
+                try:
+                    connection = listener.accept()
+                except Exception as e:
+                    print(f"Error accepting inference connection: {str(e)}")
+                    continue
+                threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+    
+    def _serve_connection(self, connection):
+        with connection:
+            while True:
+                try:
+                    message = connection.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    response = self.handle(message)
+                except Exception as e:
+                    response = {'error': str(e)}
+                connection.send(response)
+    
+    def handle(self, message: Dict) -> Any:
+        op = message.get('op')
+        if op == 'encode':
+            return np.asarray(self.embedding_batcher.submit(message['texts']).result())
+        if op == 'summarize':
+            kwargs = message.get('kwargs') or {}
+            key = tuple(sorted(kwargs.items()))
+            return self.summary_batcher.submit(message['texts'], key).result()
+        if op == 'ping':
+            return 'pong'
+        raise ValueError(f"Unknown inference op: {op}")
+    
+    def _encode_batch(self, texts: List[str], _key) -> List[np.ndarray]:
+        # A micro-batch can exceed max_batch_size when one request brings
+        # many texts; keep the model's forward passes bounded regardless
+        return list(self.embedding_model.encode(texts, batch_size=self.embedding_batch_size))
+    
+    def _summarize_batch(self, texts: List[str], key) -> List[Dict]:
+        return self.summarizer(texts, batch_size=self.summary_batch_size, **dict(key))
@@ -0,0 +1,68 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+from backend.utils.parse_cache import ParseCache
+from backend.utils.pdf_parser import parse_resume_bytes, parse_resume_file
+
+
+class ResumeIngestionPool:
+    """Process pool that parses resume PDFs as soon as they are available.
+    
+    Workers are started with the ``spawn`` method so they never inherit the
+    model weights or torch threads of the web process; they only import the
+    PDF parser. The pool is created lazily on first use.
+    
+    With a ``parse_cache``, PDFs submitted with their content hash are
+    looked up first; hits resolve immediately without reaching a worker
+    and new results are added to the cache.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, parse_cache: Optional[ParseCache] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parse_cache = parse_cache
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, pdf_path: str, content_hash: Optional[str] = None) -> Future:
+        """Schedule a PDF for parsing; the future resolves to the parsed fields"""
+        return self._cached_submit(content_hash, parse_resume_file, pdf_path)
+    
+    def submit_bytes(self, pdf_bytes: bytes, content_hash: Optional[str] = None) -> Future:
+        """Schedule an in-memory PDF for parsing"""
+        return self._cached_submit(content_hash, parse_resume_bytes, pdf_bytes)
+    
+    def _cached_submit(self, content_hash: Optional[str], fn, pdf) -> Future:
+        if self.parse_cache is None or content_hash is None:
+            return self._get_executor().submit(fn, pdf)
+        
+        fields = self.parse_cache.get(content_hash)
+        if fields is not ParseCache.MISSING:
+            future = Future()
+            future.set_result(fields)
+            return future
+        
+        future = self._get_executor().submit(fn, pdf)
+        future.add_done_callback(lambda f: self._store(content_hash, f))
+        return future
+    
+    def _store(self, content_hash: str, future: Future):
+        if not future.cancelled() and future.exception() is None:
+            self.parse_cache.put(content_hash, future.result())
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Request threads submit concurrently; only one of them may start the pool
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+    
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,110 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Optional
+
+
+class ParseCache:
+    """Persistent cache of parsed resumes, keyed by PDF content hash.
+    
+    Stores the PDFParser.parse_resume result (text and structured fields)
+    as zlib-compressed JSON in SQLite, so a resume that was seen before is
+    never parsed again. Entries belong to one parser ``version`` and lookups
+    only see their own version, so changing the parser invalidates the cache
+    automatically while processes with a different configuration (e.g.
+    another PDF backend) can share the file. Entries of old versions stay
+    until ``prune`` is run (see prune_parse_cache.py).
+    """
+    
+    # Returned by get() on a miss, since None is a valid cached result
+    MISSING = object()
+    
+    def __init__(self, db_path: str, version: str):
+        self.db_path = db_path
+        self.version = version
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The SQLite connection, opened on first use and again after a fork"""
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._pid = os.getpid()
+            with self._conn:
+                self._conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS resume_parses (
+                        content_hash TEXT NOT NULL,
+                        parser_version TEXT NOT NULL,
+                        created_at INTEGER NOT NULL,
+                        data BLOB NOT NULL,
+                        PRIMARY KEY (content_hash, parser_version)
+                    );
+                    CREATE INDEX IF NOT EXISTS resume_parses_by_age ON resume_parses (created_at);
+                """)
+        return self._conn
+    
+    def get(self, content_hash: str):
+        """Cached fields for a PDF (None if it had no text), or MISSING"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM resume_parses WHERE content_hash = ? AND parser_version = ?",
+                (content_hash, self.version)
+            ).fetchone()
+        if row is None:
+            return self.MISSING
+        return json.loads(zlib.decompress(row[0]))
+    
+    def put(self, content_hash: str, fields: Optional[Dict]):
+        data = zlib.compress(json.dumps(fields).encode('utf-8'))
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO resume_parses (content_hash, parser_version, created_at, data) "
+                "VALUES (?, ?, ?, ?)",
+                (content_hash, self.version, int(time.time()), data)
+            )
+    
+    def prune(self, keep_versions: Optional[Iterable[str]] = None,
+              max_entries: Optional[int] = None) -> int:
+        """Maintenance: delete entries of other parser versions and the oldest
+        entries beyond ``max_entries``; returns how many were deleted.
+        
+        ``keep_versions`` defaults to this cache's version. Run it while no
+        process with another configuration still relies on its entries.
+        """
+        keep_versions = list(keep_versions) if keep_versions is not None else [self.version]
+        with self._lock:
+            with self.conn:
+                placeholders = ', '.join('?' * len(keep_versions))
+                deleted = self.conn.execute(
+                    f"DELETE FROM resume_parses WHERE parser_version NOT IN ({placeholders})",
+                    keep_versions
+                ).rowcount
+                if max_entries is not None:
+                    deleted += self.conn.execute(
+                        "DELETE FROM resume_parses WHERE rowid NOT IN ("
+                        "SELECT rowid FROM resume_parses ORDER BY created_at DESC, rowid DESC LIMIT ?)",
+                        (max_entries,)
+                    ).rowcount
+            if deleted:
+                # Give the freed pages back to the file system
+                self.conn.execute("VACUUM")
+        return deleted
+    
+    def count(self) -> Dict[str, int]:
+        """Number of cached entries per parser version"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT parser_version, COUNT(*) FROM resume_parses GROUP BY parser_version"
+            ).fetchall()
+        return dict(rows)
+    
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,25 +1,56 @@
-import PyPDF2
+import io
 import re
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Union
+from backend.utils.pdf_backends import PDFTextExtractor
+from config.config import Config
 
 class PDFParser:
-    def __init__(self):
+    # Bump whenever extraction or field parsing changes; cached parses of
+    # other versions are ignored (see ParseCache)
+    VERSION = 1
+    
+    def __init__(self, backend: str = Config.PDF_BACKEND, max_pages: Optional[int] = Config.PDF_MAX_PAGES):
+        # Text extraction backend, chosen per file in "auto" mode
+        self.extractor = PDFTextExtractor(backend, max_pages, Config.PDF_MIN_CHARS_PER_PAGE)
         self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         self.phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}'
         
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text content from PDF file"""
+    @property
+    def version(self) -> str:
+        """Identifies everything that affects parse_resume output"""
+        return f"{self.VERSION}:{'+'.join(self.extractor.backend_names)}:{self.extractor.max_pages}"
+    
+    def extract_text_from_pdf(self, pdf_path: Union[str, BinaryIO]) -> str:
+        """Extract text content from a PDF file path or seekable binary stream"""
         try:
+            if hasattr(pdf_path, 'read'):
+                return self._read_pdf_text(pdf_path)
             with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+                return self._read_pdf_text(file)
         except Exception as e:
             print(f"Error extracting text from {pdf_path}: {str(e)}")
             return ""
     
+    def _read_pdf_text(self, file: BinaryIO) -> str:
+        return self.extractor.extract(file.read())
+    
+    def parse_resume(self, pdf_path: Union[str, BinaryIO]) -> Optional[Dict]:
+        """Extract text and structured fields from a resume PDF.
+        
+        Returns None when no text could be extracted.
+        """
+        text = self.extract_text_from_pdf(pdf_path)
+        if not text:
+            return None
+        
+        return {
+            'text': text,
+            'contact_info': self.extract_contact_info(text),
+            'name': self.extract_name(text),
+            'skills': self.extract_skills(text),
+            'experience': self.extract_experience_years(text)
+        }
+    
     def extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
         """Extract email and phone from resume text"""
         email_matches = re.findall(self.email_pattern, text)
@@ -77,4 +108,23 @@ class PDFParser:
             if matches:
                 return f"{matches[0]} years"
         
-        return "Not specified"
\ No newline at end of file
+        return "Not specified"
+
+
+_worker_parser: Optional[PDFParser] = None
+
+
+def parse_resume_file(pdf_path: str) -> Optional[Dict]:
+    """Module-level entry point for parsing resumes in a process pool"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = PDFParser()
+    return _worker_parser.parse_resume(pdf_path)
+
+
+def parse_resume_bytes(pdf_bytes: bytes) -> Optional[Dict]:
+    """Like parse_resume_file, for PDFs held in memory (e.g. archive members)"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = PDFParser()
+    return _worker_parser.parse_resume(io.BytesIO(pdf_bytes))
@@ -0,0 +1,61 @@
+from itertools import chain
+from typing import Dict, List
+import numpy as np
+from backend.models.candidate import Candidate
+
+SCORE_FIELDS = ('skill_match_score', 'experience_score', 'overall_score')
+
+
+def score_statistics(candidates: List[Candidate], bins: int = 10, top_skills: int = 20) -> Dict:
+    """Score distributions and skill counts over a ranked candidate set.
+    
+    Scores are reported as percentages like the ranking rows: a histogram
+    over [0, 100] and summary percentiles per score field, the overall-score
+    bands the results table colours by, and the most common skills with the
+    share of candidates listing each.
+    """
+    count = len(candidates)
+    scores = np.array(
+        [[getattr(c, field) for field in SCORE_FIELDS] for c in candidates], dtype=float
+    ).reshape(count, len(SCORE_FIELDS)) * 100
+    edges = np.linspace(0, 100, bins + 1)
+    
+    distributions = {}
+    if count:
+        percentiles = np.percentile(scores, [0, 25, 50, 75, 90, 100], axis=0)
+        means = scores.mean(axis=0)
+    for index, field in enumerate(SCORE_FIELDS):
+        histogram, _ = np.histogram(scores[:, index], bins=edges)
+        distribution = {'histogram': histogram.tolist()}
+        if count:
+            low, p25, median, p75, p90, high = percentiles[:, index].round(2).tolist()
+            distribution.update({
+                'mean': round(float(means[index]), 2),
+                'min': low, 'p25': p25, 'median': median, 'p75': p75, 'p90': p90, 'max': high
+            })
+        distributions[field] = distribution
+    
+    overall = scores[:, SCORE_FIELDS.index('overall_score')]
+    bands = {
+        'high': int(np.count_nonzero(overall >= 80)),
+        'medium': int(np.count_nonzero((overall >= 60) & (overall < 80))),
+        'low': int(np.count_nonzero(overall < 60))
+    }
+    
+    skills = []
+    flat_skills = list(chain.from_iterable(c.skills for c in candidates))
+    if flat_skills:
+        names, counts = np.unique(np.array(flat_skills), return_counts=True)
+        order = np.argsort(-counts, kind='stable')[:top_skills]
+        skills = [
+            {'skill': str(names[i]), 'count': int(counts[i]), 'share': round(float(counts[i]) / count, 4)}
+            for i in order
+        ]
+    
+    return {
+        'total': count,
+        'bin_edges': edges.round(2).tolist(),
+        'scores': distributions,
+        'bands': bands,
+        'top_skills': skills
+    }
@@ -0,0 +1,234 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from backend.models.candidate import Candidate
+
+# Times are handled internally as integer minutes since the Unix epoch (UTC)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_minutes(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int((dt - _EPOCH).total_seconds() // 60)
+
+
+def _from_minutes(minutes: int) -> datetime:
+    return _EPOCH + timedelta(minutes=minutes)
+
+
+@dataclass
+class Interviewer:
+    email: str
+    # Existing events as (start, end); naive datetimes are taken as UTC
+    busy: List[Tuple[datetime, datetime]] = field(default_factory=list)
+    timezone: str = 'UTC'
+    work_start_hour: int = 9
+    work_end_hour: int = 17
+
+
+@dataclass
+class InterviewAssignment:
+    candidate: Candidate
+    start: datetime
+    end: datetime
+    interviewers: List[str]
+
+
+@dataclass
+class SchedulingResult:
+    assignments: List[InterviewAssignment]
+    unscheduled: List[Candidate]
+
+
+class _FreeIntervals:
+    """Sorted, disjoint free intervals (in minutes) with O(log n) lookups"""
+    
+    def __init__(self, intervals: List[Tuple[int, int]]):
+        self.starts = [start for start, _ in intervals]
+        self.ends = [end for _, end in intervals]
+    
+    def earliest_fit(self, t: int, duration: int, granularity: int) -> Optional[int]:
+        """Earliest aligned start >= t such that [start, start + duration] is free"""
+        index = bisect_right(self.ends, t)
+        while index < len(self.starts):
+            start = _align_up(max(self.starts[index], t), granularity)
+            if start + duration <= self.ends[index]:
+                return start
+            index += 1
+        return None
+    
+    def reserve(self, start: int, end: int):
+        """Remove [start, end] from the free intervals (clipped to what is free)"""
+        index = bisect_right(self.ends, start)
+        while index < len(self.starts) and self.starts[index] < end:
+            free_start, free_end = self.starts[index], self.ends[index]
+            pieces = []
+            if free_start < start:
+                pieces.append((free_start, start))
+            if end < free_end:
+                pieces.append((end, free_end))
+            self.starts[index:index + 1] = [p[0] for p in pieces]
+            self.ends[index:index + 1] = [p[1] for p in pieces]
+            index += len(pieces)
+
+
+def _align_up(t: int, granularity: int) -> int:
+    return -(-t // granularity) * granularity
+
+
+def _working_windows(window_start: int, window_end: int, tz_name: str,
+                     start_hour: int, end_hour: int) -> List[Tuple[int, int]]:
+    """Weekday working-hour windows in a time zone, as UTC minute intervals"""
+    tz = ZoneInfo(tz_name or 'UTC')
+    day = _from_minutes(window_start).astimezone(tz).date() - timedelta(days=1)
+    last_day = _from_minutes(window_end).astimezone(tz).date()
+    windows = []
+    while day <= last_day:
+        if day.weekday() < 5:
+            start = _to_minutes(datetime(day.year, day.month, day.day, start_hour, tzinfo=tz))
+            end = _to_minutes(datetime(day.year, day.month, day.day, end_hour, tzinfo=tz))
+            start, end = max(start, window_start), min(end, window_end)
+            if start < end:
+                windows.append((start, end))
+        day += timedelta(days=1)
+    return windows
+
+
+def _subtract(windows: List[Tuple[int, int]], busy: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Remove sorted, possibly overlapping busy intervals from sorted windows"""
+    free = []
+    busy_index = 0
+    for start, end in windows:
+        while busy_index < len(busy) and busy[busy_index][1] <= start:
+            busy_index += 1
+        cursor = start
+        index = busy_index
+        while index < len(busy) and busy[index][0] < end:
+            busy_start, busy_end = busy[index]
+            if busy_start > cursor:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            index += 1
+        if cursor < end:
+            free.append((cursor, end))
+    return free
+
+
+class SchedulingEngine:
+    """Assign interview slots from interviewers' real free/busy calendars.
+    
+    Candidates are scheduled greedily in priority order (highest
+    ``overall_score`` first), each at the earliest time when ``panel_size``
+    interviewers are free for the slot plus buffers and the time falls in
+    the candidate's working hours in their own time zone. Free time is kept
+    as sorted interval lists per interviewer, so finding a slot is a few
+    binary searches rather than a scan over every event, and hundreds of
+    candidates schedule in milliseconds.
+    """
+    
+    def __init__(self,
+                 slot_minutes: int = 60,
+                 buffer_minutes: int = 15,
+                 granularity_minutes: int = 15,
+                 panel_size: int = 1,
+                 candidate_hours: Tuple[int, int] = (9, 18)):
+        if slot_minutes <= 0 or granularity_minutes <= 0:
+            raise ValueError("slot_minutes and granularity_minutes must be positive")
+        if buffer_minutes < 0:
+            raise ValueError("buffer_minutes must not be negative")
+        if panel_size < 1:
+            raise ValueError("panel_size must be at least 1")
+        self.slot_minutes = slot_minutes
+        self.buffer_minutes = buffer_minutes
+        self.granularity_minutes = granularity_minutes
+        self.panel_size = panel_size
+        self.candidate_hours = candidate_hours
+    
+    def schedule(self,
+                 candidates: List[Candidate],
+                 interviewers: List[Interviewer],
+                 window_start: datetime,
+                 window_end: datetime) -> SchedulingResult:
+        start, end = _to_minutes(window_start), _to_minutes(window_end)
+        if len(interviewers) < self.panel_size:
+            return SchedulingResult([], list(candidates))
+        
+        # Existing events are padded by the buffer on both sides
+        buffer = self.buffer_minutes
+        free: Dict[str, _FreeIntervals] = {}
+        for interviewer in interviewers:
+            busy = sorted(
+                (_to_minutes(busy_start) - buffer, _to_minutes(busy_end) + buffer)
+                for busy_start, busy_end in interviewer.busy
+            )
+            windows = _working_windows(start, end, interviewer.timezone,
+                                       interviewer.work_start_hour, interviewer.work_end_hour)
+            free[interviewer.email] = _FreeIntervals(_subtract(windows, busy))
+        load = {interviewer.email: 0 for interviewer in interviewers}
+        
+        # Candidate working-hour windows, shared by candidates in the same zone
+        candidate_windows: Dict[str, _FreeIntervals] = {}
+        
+        assignments = []
+        unscheduled = []
+        for candidate in sorted(candidates, key=lambda c: c.overall_score, reverse=True):
+            tz_name = getattr(candidate, 'timezone', None) or 'UTC'
+            if tz_name not in candidate_windows:
+                candidate_windows[tz_name] = _FreeIntervals(
+                    _working_windows(start, end, tz_name, *self.candidate_hours)
+                )
+            
+            slot = self._find_slot(start, candidate_windows[tz_name], free, load)
+            if slot is None:
+                unscheduled.append(candidate)
+                continue
+            
+            slot_start, panel = slot
+            slot_end = slot_start + self.slot_minutes
+            for email in panel:
+                free[email].reserve(slot_start - buffer, slot_end + buffer)
+                load[email] += 1
+            assignments.append(InterviewAssignment(
+                candidate=candidate,
+                start=_from_minutes(slot_start),
+                end=_from_minutes(slot_end),
+                interviewers=panel
+            ))
+        
+        assignments.sort(key=lambda a: a.start)
+        return SchedulingResult(assignments, unscheduled)
+    
+    def _find_slot(self, t: int, candidate_free: _FreeIntervals, free: Dict[str, _FreeIntervals],
+                   load: Dict[str, int]) -> Optional[Tuple[int, List[str]]]:
+        """Earliest start >= t that suits the candidate and a full panel.
+        
+        Repeatedly moves t to the latest of the candidate's next fit and the
+        panel_size-th earliest interviewer fit, until all agree on t.
+        """
+        duration = self.slot_minutes
+        granularity = self.granularity_minutes
+        t = _align_up(t, granularity)
+        while True:
+            candidate_fit = candidate_free.earliest_fit(t, duration, granularity)
+            if candidate_fit is None:
+                return None
+            t = candidate_fit
+            
+            fits = []
+            for email, intervals in free.items():
+                fit = intervals.earliest_fit(t, duration, granularity)
+                if fit is not None:
+                    fits.append((fit, email))
+            if len(fits) < self.panel_size:
+                return None
+            fits.sort()
+            
+            panel_fit = fits[self.panel_size - 1][0]
+            if panel_fit == t:
+                # Of the interviewers free at t, prefer the least loaded
+                available = sorted((load[email], email) for fit, email in fits if fit == t)
+                return t, [email for _, email in available[:self.panel_size]]
+            t = panel_fit
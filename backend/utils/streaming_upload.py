@@ -0,0 +1,243 @@
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import BinaryIO, Dict, List
+from werkzeug.utils import secure_filename
+from backend.utils.archive_import import ARCHIVE_EXTENSIONS, ArchiveImporter, ArchiveImportProgress, is_archive
+from backend.utils.ingestion import ResumeIngestionPool
+from backend.utils.upload_store import UploadStore
+
+
+class UnsupportedFileTypeError(ValueError):
+    pass
+
+
+class UploadSession:
+    def __init__(self, upload_id: str, staging_dir: str):
+        self.upload_id = upload_id
+        self.staging_dir = staging_dir
+        # Bytes received so far for each file still being uploaded
+        self.offsets: Dict[str, int] = {}
+        # content_hash -> (stored path, parse future) for completed files
+        self.completed: Dict[str, tuple] = {}
+        self.skipped_duplicates: List[str] = []
+        # Archive imports running in the background, by archive filename
+        self.archive_imports: Dict[str, ArchiveImportProgress] = {}
+        self.import_threads: List[threading.Thread] = []
+        self.lock = threading.Lock()
+        self.last_activity = time.monotonic()
+    
+    def is_busy(self) -> bool:
+        return any(thread.is_alive() for thread in self.import_threads)
+
+
+class StreamingUploadManager:
+    """Resumable, chunked resume uploads written straight to disk.
+    
+    A client opens a session, then sends each file as a sequence of raw
+    chunks at increasing offsets. Chunks are copied to a staging file in
+    ``CHUNK_SIZE`` pieces, so memory use is bounded regardless of file or
+    batch size. When the last chunk of a file arrives it is moved into the
+    content-addressed UploadStore and handed to the ingestion pool, so PDF
+    extraction overlaps with the rest of the upload. ZIP and tar archives
+    are accepted too; their PDF members are imported in the background.
+    
+    Sessions left idle for ``session_ttl`` seconds (abandoned uploads) are
+    removed, together with their staging files, whenever a new session is
+    created.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, upload_store: UploadStore, ingestion_pool: ResumeIngestionPool,
+                 archive_importer: ArchiveImporter, session_ttl: float = 6 * 3600):
+        self.upload_store = upload_store
+        self.ingestion_pool = ingestion_pool
+        self.archive_importer = archive_importer
+        self.session_ttl = session_ttl
+        self.staging_root = os.path.join(upload_store.upload_folder, '_staging')
+        self._sessions: Dict[str, UploadSession] = {}
+        self._lock = threading.Lock()
+    
+    def create_session(self) -> str:
+        self.expire_sessions()
+        upload_id = uuid.uuid4().hex
+        staging_dir = os.path.join(self.staging_root, upload_id)
+        os.makedirs(staging_dir, exist_ok=True)
+        with self._lock:
+            self._sessions[upload_id] = UploadSession(upload_id, staging_dir)
+        return upload_id
+    
+    def get_session(self, upload_id: str) -> UploadSession:
+        with self._lock:
+            session = self._sessions.get(upload_id)
+        if session is None:
+            raise KeyError(f"Unknown upload session: {upload_id}")
+        session.last_activity = time.monotonic()
+        return session
+    
+    def expire_sessions(self) -> int:
+        """Remove sessions idle for longer than session_ttl; returns how many.
+        
+        Staging directories that belong to no session (left behind by an
+        earlier process) are removed once they are as old as the TTL.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                upload_id for upload_id, session in self._sessions.items()
+                if now - session.last_activity > self.session_ttl and not session.is_busy()
+            ]
+            known = set(self._sessions)
+        for upload_id in expired:
+            self.close_session(upload_id)
+        
+        if os.path.isdir(self.staging_root):
+            cutoff = time.time() - self.session_ttl
+            for name in os.listdir(self.staging_root):
+                path = os.path.join(self.staging_root, name)
+                if name not in known and os.path.getmtime(path) < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+        return len(expired)
+    
+    def get_offset(self, upload_id: str, filename: str) -> int:
+        """Bytes already received for a file (to resume an interrupted upload)"""
+        session = self.get_session(upload_id)
+        with session.lock:
+            return session.offsets.get(_safe_name(filename), 0)
+    
+    def write_chunk(self, upload_id: str, filename: str, stream: BinaryIO,
+                    offset: int, final: bool = False) -> Dict:
+        """Append one chunk of a file at ``offset``.
+        
+        Raises UnsupportedFileTypeError for anything but PDFs and archives,
+        and ValueError when the offset does not match the bytes received so
+        far; the client should query get_offset and resume from there.
+        """
+        session = self.get_session(upload_id)
+        safe_name = _safe_name(filename)
+        
+        staging_path = os.path.join(session.staging_dir, safe_name)
+        with session.lock:
+            expected = session.offsets.get(safe_name, 0)
+            if offset != expected:
+                raise ValueError(f"Offset mismatch for {filename}: expected {expected}, got {offset}")
+            
+            with open(staging_path, 'ab') as staging_file:
+                while True:
+                    chunk = stream.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    staging_file.write(chunk)
+                    expected += len(chunk)
+            session.offsets[safe_name] = expected
+        
+        result = {'filename': safe_name, 'offset': expected, 'complete': False}
+        if final:
+            result.update(self._complete_file(session, safe_name, staging_path,
+                                              os.path.basename(filename)))
+        return result
+    
+    def _complete_file(self, session: UploadSession, safe_name: str, staging_path: str,
+                       original_name: str) -> Dict:
+        with open(staging_path, 'rb') as staged:
+            file_path, content_hash, _ = self.upload_store.save_stream(staged, safe_name)
+        os.remove(staging_path)
+        
+        with session.lock:
+            session.offsets.pop(safe_name, None)
+            if content_hash in session.completed or content_hash in session.archive_imports:
+                session.skipped_duplicates.append(original_name)
+                return {'complete': True, 'duplicate': True}
+            
+            if is_archive(safe_name):
+                self._start_archive_import(session, file_path, content_hash)
+                return {'complete': True, 'duplicate': False, 'archive': True}
+            
+            future = self.ingestion_pool.submit(file_path, content_hash)
+            session.completed[content_hash] = (file_path, future)
+        
+        return {'complete': True, 'duplicate': False}
+    
+    def _start_archive_import(self, session: UploadSession, archive_path: str, content_hash: str):
+        progress = ArchiveImportProgress(archive=os.path.basename(archive_path))
+        session.archive_imports[content_hash] = progress
+        
+        def on_batch(results):
+            with session.lock:
+                for member_path, member_hash, fields in results:
+                    session.completed[member_hash] = (member_path, _resolved(fields))
+        
+        def run():
+            with session.lock:
+                seen_hashes = set(session.completed)
+            self.archive_importer.import_archive(archive_path, on_batch, progress, seen_hashes)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        session.import_threads.append(thread)
+        thread.start()
+    
+    def get_progress(self, upload_id: str) -> Dict:
+        """Completed files and the progress of any archive imports"""
+        session = self.get_session(upload_id)
+        with session.lock:
+            return {
+                'files_completed': len(session.completed),
+                'files_in_progress': len(session.offsets),
+                'skipped_duplicates': list(session.skipped_duplicates),
+                'archives': [progress.to_dict() for progress in session.archive_imports.values()]
+            }
+    
+    def collect(self, upload_id: str) -> List[tuple]:
+        """Return (file_path, content_hash, parse_future) for every completed file
+        
+        Waits for background archive imports of the session to finish.
+        """
+        session = self.get_session(upload_id)
+        for thread in list(session.import_threads):
+            thread.join()
+        with session.lock:
+            return [
+                (file_path, content_hash, future)
+                for content_hash, (file_path, future) in session.completed.items()
+            ]
+    
+    def close_session(self, upload_id: str):
+        """Forget a session and remove any partially uploaded files"""
+        with self._lock:
+            session = self._sessions.pop(upload_id, None)
+        if session is None:
+            return
+        shutil.rmtree(session.staging_dir, ignore_errors=True)
+
+
+def _safe_name(filename: str) -> str:
+    """Name to stage and store an uploaded file under.
+    
+    The type is checked on the name as sent, since secure_filename drops
+    non-ASCII characters and can turn e.g. "Лебедев.pdf" into "pdf". When
+    nothing of the stem survives, a name derived from the original one is
+    used, so every chunk of the same file maps to the same staging file.
+    """
+    basename = os.path.basename(filename.replace('\\', '/'))
+    lowered = basename.lower()
+    suffix = next((ext for ext in ('.pdf',) + ARCHIVE_EXTENSIONS if lowered.endswith(ext)), None)
+    if suffix is None:
+        raise UnsupportedFileTypeError(f"Only PDF files and ZIP/tar archives are accepted: {filename}")
+    
+    safe_name = secure_filename(basename)
+    stem = safe_name[:-len(suffix)] if safe_name.lower().endswith(suffix) else ''
+    if not stem.strip('._-'):
+        digest = hashlib.sha256(basename.encode('utf-8')).hexdigest()[:16]
+        safe_name = f"upload-{digest}{suffix}"
+    return safe_name
+
+
+def _resolved(result) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
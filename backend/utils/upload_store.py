@@ -0,0 +1,68 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, Tuple
+from werkzeug.utils import secure_filename
+
+
+class UploadStore:
+    """Content-addressed storage for uploaded resumes.
+    
+    Each file is stored as ``<upload_folder>/<sha256>/<filename>``, so the
+    same PDF uploaded twice (under any name) is detected from its hash and
+    never written or processed again, and same-named files from different
+    candidates no longer overwrite each other.
+    """
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, upload_folder: str):
+        self.upload_folder = upload_folder
+        os.makedirs(self.upload_folder, exist_ok=True)
+    
+    def save(self, file_storage) -> Tuple[str, str, bool]:
+        """Save a Werkzeug FileStorage; see save_stream for the return value"""
+        return self.save_stream(file_storage.stream, file_storage.filename)
+    
+    def save_stream(self, stream: BinaryIO, filename: str) -> Tuple[str, str, bool]:
+        """Hash and store a binary stream chunk by chunk.
+        
+        Returns (file_path, content_hash, is_new). When the content is
+        already stored, the existing path is returned and is_new is False.
+        """
+        hasher = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=self.upload_folder, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                while True:
+                    chunk = stream.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    temp_file.write(chunk)
+            
+            content_hash = hasher.hexdigest()
+            existing_path = self.find(content_hash)
+            if existing_path:
+                return existing_path, content_hash, False
+            
+            file_path = self._path_for(content_hash, filename)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            shutil.move(temp_path, file_path)
+            return file_path, content_hash, True
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def find(self, content_hash: str) -> str:
+        """Return the stored path for a content hash, or an empty string"""
+        hash_dir = os.path.join(self.upload_folder, content_hash)
+        if os.path.isdir(hash_dir):
+            for name in sorted(os.listdir(hash_dir)):
+                return os.path.join(hash_dir, name)
+        return ""
+    
+    def _path_for(self, content_hash: str, filename: str) -> str:
+        safe_name = secure_filename(filename or '') or 'resume.pdf'
+        return os.path.join(self.upload_folder, content_hash, safe_name)
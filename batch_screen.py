@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - Headless Batch Screening
+
+Screens every resume PDF in a directory against one or more job
+descriptions without the web app, writing one ranked CSV/Parquet file per
+job. Models are loaded once, resumes are parsed once in a process pool and
+shared across jobs, and progress is checkpointed so an interrupted run can
+be restarted with the same command.
+
+Job files are JSON objects (or lists of objects) with the fields
+title, description, required_skills, experience_required, qualifications
+and an optional id.
+
+Example:
+    python batch_screen.py resumes/ jobs/backend.json jobs/data.json \
+        --output-dir results --format parquet --workers 8
+"""
+
+import argparse
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from config.config import Config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Screen a directory of resumes against job descriptions")
+    parser.add_argument('resume_dir', help="Directory containing resume PDFs (searched recursively)")
+    parser.add_argument('job_files', nargs='+', help="JSON job description files")
+    parser.add_argument('--output-dir', default='screening_results')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--checkpoint-dir', default=None,
+                        help="Checkpoint directory (default: <output-dir>/.checkpoint)")
+    parser.add_argument('--workers', type=int, default=Config.PARSE_WORKERS,
+                        help="Parallel PDF parsing processes")
+    parser.add_argument('--summaries', action='store_true',
+                        help="Generate AI summaries (slow: one model call per candidate per job)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    
+    # Imported here so --help works without loading the models
+    from backend.agents.batch_screener import BatchScreener
+    from backend.agents.resume_processor import ResumeProcessor
+    from backend.agents.candidate_ranker import CandidateRanker
+    from backend.utils.ingestion import ResumeIngestionPool
+    
+    try:
+        BatchScreener.check_output_format(args.format)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    jobs = BatchScreener.load_jobs(args.job_files)
+    print(f"Loaded {len(jobs)} job descriptions")
+    
+    print("Loading models...")
+    # The summarization model is only needed with --summaries
+    resume_processor = ResumeProcessor(load_summarizer=args.summaries)
+    candidate_ranker = CandidateRanker()
+    ingestion_pool = ResumeIngestionPool(args.workers, resume_processor.parse_cache)
+    
+    checkpoint_dir = args.checkpoint_dir or os.path.join(args.output_dir, '.checkpoint')
+    screener = BatchScreener(resume_processor, candidate_ranker, ingestion_pool, checkpoint_dir)
+    
+    try:
+        outputs = screener.run(
+            args.resume_dir, jobs, args.output_dir,
+            output_format=args.format, summarize=args.summaries
+        )
+    finally:
+        ingestion_pool.shutdown()
+    
+    for job_id, output_path in outputs.items():
+        print(f"{job_id}: {output_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - PDF Extraction Benchmark
+
+Compares throughput and extraction quality of the PDF text backends on a
+directory of resumes (by default the synthetic corpus written by
+generate_sample_resumes.py):
+
+    python generate_sample_resumes.py
+    python benchmark_pdf_backends.py sample_resumes --repeat 20
+
+Quality is reported as how often the parser still finds an email, a name
+matching the "First_Last_resume.pdf" file name, and the skills that the
+reference backend (PyPDF2) finds.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from backend.utils.pdf_backends import BACKENDS
+from backend.utils.pdf_parser import PDFParser
+from config.config import Config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark PDF text extraction backends")
+    parser.add_argument('resume_dir', nargs='?', default='sample_resumes')
+    parser.add_argument('--repeat', type=int, default=10, help="Passes over the corpus per backend")
+    parser.add_argument('--max-pages', type=int, default=Config.PDF_MAX_PAGES)
+    return parser.parse_args()
+
+
+def expected_name(path):
+    match = re.match(r'([A-Za-z]+)_([A-Za-z]+)_resume\.pdf$', os.path.basename(path))
+    return f"{match.group(1)} {match.group(2)}" if match else None
+
+
+def run_backend(backend, files, repeat, max_pages):
+    parser = PDFParser(backend, max_pages)
+    results = {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path, data in files.items():
+            text = parser.extractor.extract(data)
+            results[path] = {
+                'chars': len(text),
+                'name': parser.extract_name(text),
+                'email': parser.extract_contact_info(text)['email'],
+                'skills': set(parser.extract_skills(text))
+            }
+    elapsed = time.perf_counter() - start
+    return elapsed, results
+
+
+def main():
+    args = parse_args()
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(args.resume_dir)
+        for name in names if name.lower().endswith('.pdf')
+    )
+    if not paths:
+        print(f"No PDFs found in {args.resume_dir}")
+        return 1
+    files = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            files[path] = f.read()
+
+    backends = ['auto'] + [name for name, cls in BACKENDS.items() if cls.available()]
+    print(f"{len(files)} PDFs x {args.repeat} passes; backends: {', '.join(backends)}\n")
+
+    _, reference = run_backend('pypdf2', files, 1, args.max_pages)
+    print(f"{'backend':<10} {'files/s':>9} {'avg chars':>10} {'email':>7} {'name':>7} {'skills':>7}")
+    for backend in backends:
+        elapsed, results = run_backend(backend, files, args.repeat, args.max_pages)
+        count = len(results)
+        emails = sum(1 for r in results.values() if r['email'])
+        named = [p for p in results if expected_name(p)]
+        names = sum(1 for p in named if results[p]['name'] == expected_name(p))
+        ref_skills = sum(len(reference[p]['skills']) for p in results)
+        found_skills = sum(len(results[p]['skills'] & reference[p]['skills']) for p in results)
+        print(f"{backend:<10} {count * args.repeat / elapsed:>9.1f} "
+              f"{sum(r['chars'] for r in results.values()) / count:>10.0f} "
+              f"{emails / count:>7.0%} "
+              f"{(names / len(named) if named else float('nan')):>7.0%} "
+              f"{(found_skills / ref_skills if ref_skills else 1):>7.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
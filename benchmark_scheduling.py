@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - Scheduling Benchmark
+
+Generates synthetic interviewer calendars and candidates (random time zones
+and scores), then compares the constraint-based SchedulingEngine with the
+fixed 9-5 hourly slots used by InterviewScheduler.schedule_interviews:
+
+    python benchmark_scheduling.py --candidates 500 --interviewers 20 --days 15
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from backend.models.candidate import Candidate
+from backend.utils.scheduling_engine import Interviewer, SchedulingEngine
+
+TIMEZONES = ['UTC', 'Europe/London', 'Europe/Berlin', 'America/New_York',
+             'America/Los_Angeles', 'Asia/Kolkata', 'Asia/Singapore']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark interview scheduling on synthetic calendars")
+    parser.add_argument('--candidates', type=int, default=300)
+    parser.add_argument('--interviewers', type=int, default=12)
+    parser.add_argument('--days', type=int, default=15, help="Scheduling window in days")
+    parser.add_argument('--busy-per-day', type=int, default=3, help="Existing events per interviewer per day")
+    parser.add_argument('--panel-size', type=int, default=1)
+    parser.add_argument('--slot-minutes', type=int, default=60)
+    parser.add_argument('--buffer-minutes', type=int, default=15)
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+def make_interviewers(count, window_start, days, busy_per_day, rng):
+    interviewers = []
+    for i in range(count):
+        busy = []
+        for day in range(days):
+            day_start = window_start + timedelta(days=day)
+            for _ in range(busy_per_day):
+                start = day_start + timedelta(minutes=rng.randrange(0, 24 * 60, 15))
+                busy.append((start, start + timedelta(minutes=rng.choice([30, 60, 90]))))
+        interviewers.append(Interviewer(
+            email=f"interviewer{i + 1}@example.com",
+            busy=busy,
+            timezone=rng.choice(TIMEZONES)
+        ))
+    return interviewers
+
+
+def make_candidates(count, rng):
+    return [
+        Candidate(
+            name=f"Candidate {i + 1}",
+            email=f"candidate{i + 1}@example.com",
+            phone=None,
+            experience="",
+            skills=[],
+            education="",
+            resume_text="",
+            filename=f"candidate{i + 1}.pdf",
+            overall_score=rng.random(),
+            timezone=rng.choice(TIMEZONES)
+        )
+        for i in range(count)
+    ]
+
+
+def naive_schedule(candidates, interviewers, window_start):
+    """Fixed 1-hour slots 9-5 UTC on working days, interviewers round robin"""
+    slots = []
+    day = window_start
+    slot_index = 0
+    for i, candidate in enumerate(candidates):
+        if slot_index >= 8:
+            day += timedelta(days=1)
+            slot_index = 0
+        while day.weekday() >= 5:
+            day += timedelta(days=1)
+        start = day.replace(hour=9 + slot_index)
+        slot_index += 1
+        interviewer = interviewers[i % len(interviewers)]
+        slots.append((candidate, start, start + timedelta(hours=1), [interviewer.email]))
+    return slots
+
+
+def count_conflicts(slots, interviewers):
+    """Slots overlapping an interviewer's existing events or their other interviews"""
+    busy = {interviewer.email: list(interviewer.busy) for interviewer in interviewers}
+    conflicts = 0
+    for _, start, end, panel in sorted(slots, key=lambda s: s[1]):
+        if any(busy_start < end and start < busy_end
+               for email in panel for busy_start, busy_end in busy[email]):
+            conflicts += 1
+        for email in panel:
+            busy[email].append((start, end))
+    return conflicts
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    window_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    window_end = window_start + timedelta(days=args.days)
+
+    interviewers = make_interviewers(args.interviewers, window_start, args.days, args.busy_per_day, rng)
+    candidates = make_candidates(args.candidates, rng)
+    print(f"{len(candidates)} candidates, {len(interviewers)} interviewers, "
+          f"{sum(len(i.busy) for i in interviewers)} existing events over {args.days} days")
+
+    engine = SchedulingEngine(
+        slot_minutes=args.slot_minutes,
+        buffer_minutes=args.buffer_minutes,
+        panel_size=args.panel_size
+    )
+    start = time.perf_counter()
+    result = engine.schedule(candidates, interviewers, window_start, window_end)
+    elapsed = time.perf_counter() - start
+    engine_slots = [(a.candidate, a.start, a.end, a.interviewers) for a in result.assignments]
+
+    scheduled = [a.candidate.overall_score for a in result.assignments]
+    print(f"\nSchedulingEngine: {elapsed * 1000:.1f} ms")
+    print(f"  scheduled   {len(result.assignments)}/{len(candidates)}")
+    print(f"  conflicts   {count_conflicts(engine_slots, interviewers)}")
+    if scheduled:
+        print(f"  min score scheduled {min(scheduled):.3f}")
+
+    naive_slots = naive_schedule(candidates, interviewers, window_start)
+    print("\nFixed 9-5 slots:")
+    print(f"  scheduled   {len(naive_slots)}/{len(candidates)}")
+    print(f"  conflicts   {count_conflicts(naive_slots, interviewers)}")
+    print(f"  last slot   {naive_slots[-1][1]:%Y-%m-%d %H:%M} UTC" if naive_slots else "")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,18 +6,74 @@ load_dotenv()
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key-here'
     UPLOAD_FOLDER = 'uploads'
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max request (per chunk for streaming uploads)
+    UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # chunk size used by the web client
+    UPLOAD_SESSION_TTL = int(os.environ.get('UPLOAD_SESSION_TTL', 6 * 3600))  # idle seconds before cleanup
+    PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', os.cpu_count() or 1))
+    
+    # Serving (see gunicorn.conf.py)
+    DEBUG = os.environ.get('FLASK_DEBUG', '0') == '1'
+    SERVER_BIND = os.environ.get('BIND', '0.0.0.0:5000')
+    # Job, ranking, selection and upload sessions live in process memory, so
+    # more than one worker needs that state moved to a shared store first;
+    # scale a single worker with threads instead
+    SERVER_WORKERS = int(os.environ.get('WEB_WORKERS', 1))
+    SERVER_THREADS = int(os.environ.get('WEB_THREADS', 8))
+    SERVER_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', 600))  # resume processing can take minutes
+    INFERENCE_THREADS = int(os.environ.get('INFERENCE_THREADS', 1))  # concurrent model calls per worker
+    TORCH_THREADS = int(os.environ.get('TORCH_THREADS', 0)) or None  # per worker; None = torch default
+    
+    # PDF text extraction: "auto" picks per file between pypdfium2 (fast),
+    # PyPDF2 and pdfminer.six (layout-aware, used for low-text pages);
+    # or force one of "pdfium", "pypdf2", "pdfminer"
+    PDF_BACKEND = os.environ.get('PDF_BACKEND', 'auto')
+    PDF_MAX_PAGES = 10  # later pages of huge documents are not read
+    PDF_MIN_CHARS_PER_PAGE = 100
+    # Parsed resumes by PDF hash (SQLite); empty disables the cache
+    PARSE_CACHE_PATH = os.environ.get('PARSE_CACHE_PATH', 'parse_cache.sqlite3')
+    
+    # Archive (ZIP/tar) imports
+    ARCHIVE_BATCH_SIZE = 32
+    ARCHIVE_MAX_MEMBER_SIZE = 16 * 1024 * 1024
     
     # HuggingFace Models
     EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
     SUMMARIZATION_MODEL = "facebook/bart-large-cnn"
     
+    # Overall-fit scoring: "truncated" embeds the first 1000 characters of
+    # each resume, "chunked" embeds the whole resume in sentence-aware windows
+    # (opt-in: it changes scores and rankings and costs more embeddings)
+    OVERALL_FIT_MODE = os.environ.get('OVERALL_FIT_MODE', 'truncated')
+    CHUNK_MAX_CHARS = 500
+    CHUNK_AGGREGATION = 'topk_mean'  # "max" or "topk_mean"
+    CHUNK_TOP_K = 3
+    EMBEDDING_BATCH_SIZE = 64
+    EMBEDDING_CACHE_SIZE = 20000
+    SUMMARY_BATCH_SIZE = 8
+    
+    # Shared inference server (run_inference_server.py). When set, the agents
+    # send model calls to it instead of loading the models themselves
+    INFERENCE_SOCKET = os.environ.get('INFERENCE_SOCKET')
+    INFERENCE_MAX_BATCH = 64
+    INFERENCE_MAX_WAIT_MS = 10
+    
+    # Resumes whose TF-IDF text similarity reaches this are merged
+    DUPLICATE_TEXT_SIMILARITY = 0.95
+    
     # Google Calendar API
     GOOGLE_CREDENTIALS_FILE = 'credentials.json'
     GOOGLE_TOKEN_FILE = 'token.json'
     
+    # Create calendar events and send emails concurrently with asyncio
+    # (needs aiohttp and aiosmtplib)
+    ASYNC_AGENTS = os.environ.get('ASYNC_AGENTS', '0') == '1'
+    ASYNC_MAX_CONCURRENCY = 10
+    ASYNC_REQUEST_TIMEOUT = 30  # seconds per calendar request or email
+    ASYNC_TOTAL_TIMEOUT = 300  # remaining requests are cancelled after this
+    
     # Email settings
     SMTP_SERVER = "smtp.gmail.com"
     SMTP_PORT = 587
+    SMTP_STARTTLS = os.environ.get('SMTP_STARTTLS', '1') == '1'
     EMAIL_ADDRESS = os.environ.get('EMAIL_ADDRESS')
     EMAIL_PASSWORD = os.environ.get('EMAIL_PASSWORD')
\ No newline at end of file
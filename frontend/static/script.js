@@ -1,6 +1,16 @@
+// Results table: only the rows in view are in the DOM, pages are fetched on demand
+const ROW_HEIGHT = 49;
+const PAGE_SIZE = 100;
+const OVERSCAN_ROWS = 10;
+
 class HRAgentApp {
     constructor() {
-        this.selectedCandidates = [];
+        // When selection.all is set, selection.ids holds the exclusions
+        this.selection = { all: false, ids: new Set() };
+        this.rows = [];
+        this.totalCandidates = 0;
+        this.pendingPages = new Set();
+        this.resultsVersion = 0;
         this.loadingModal = new bootstrap.Modal(document.getElementById('loadingModal'));
         this.initEventListeners();
     }
@@ -35,6 +45,26 @@ class HRAgentApp {
         document.getElementById('sendEmailsBtn').addEventListener('click', () => {
             this.sendConfirmationEmails();
         });
+        
+        // Add late resumes to the current job
+        document.getElementById('appendBtn').addEventListener('click', () => {
+            document.getElementById('appendResumes').click();
+        });
+        document.getElementById('appendResumes').addEventListener('change', (e) => {
+            this.appendResumes(e.target.files);
+            e.target.value = '';
+        });
+        
+        // Render the rows scrolled into view
+        let frameRequested = false;
+        document.getElementById('candidates-scroll').addEventListener('scroll', () => {
+            if (frameRequested) return;
+            frameRequested = true;
+            requestAnimationFrame(() => {
+                frameRequested = false;
+                this.renderVisibleRows();
+            });
+        });
     }
     
     displaySelectedFiles(files) {
@@ -81,31 +111,33 @@ class HRAgentApp {
         this.showLoading('Processing Resumes', 'Analyzing resumes and ranking candidates...');
         
         try {
-            // Prepare form data
-            const formData = new FormData();
-            
-            // Add job description data
+            // Job description data
+            const jobData = {};
             const formInputs = form.querySelectorAll('input, textarea');
             formInputs.forEach(input => {
-                formData.append(input.name, input.value);
+                jobData[input.name] = input.value;
             });
             
-            // Add resume files
-            Array.from(resumeInput.files).forEach(file => {
-                formData.append('resumes', file);
-            });
+            // Stream resume files to the server in chunks; parsing starts
+            // on the server as soon as each file completes
+            const session = await (await fetch('/api/uploads', { method: 'POST' })).json();
+            for (const file of Array.from(resumeInput.files)) {
+                await this.uploadFileInChunks(session.upload_id, file, session.chunk_size);
+            }
             
-            // Send request
-            const response = await fetch('/api/process_job', {
+            // Rank the uploaded resumes
+            const response = await fetch(`/api/uploads/${session.upload_id}/process?page_size=${PAGE_SIZE}`, {
                 method: 'POST',
-                body: formData
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(jobData)
             });
             
             const result = await response.json();
             
             if (result.success) {
                 this.displayResults(result);
-                this.showAlert('success', `Successfully processed ${result.candidates.length} candidates!`);
+                this.showAlert('success', `Successfully processed ${result.total_candidates} candidates!`);
+                this.showDuplicateReport(result);
             } else {
                 this.showAlert('danger', result.error || 'Processing failed');
             }
@@ -118,29 +150,203 @@ class HRAgentApp {
         }
     }
     
+    async appendResumes(files) {
+        if (files.length === 0) return;
+        
+        this.showLoading('Adding Resumes', 'Processing new resumes and updating the ranking...');
+        
+        try {
+            const session = await (await fetch('/api/uploads', { method: 'POST' })).json();
+            for (const file of Array.from(files)) {
+                await this.uploadFileInChunks(session.upload_id, file, session.chunk_size);
+            }
+            
+            const response = await fetch(`/api/append_resumes?page_size=${PAGE_SIZE}`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ upload_id: session.upload_id })
+            });
+            const result = await response.json();
+            
+            if (result.success) {
+                this.displayResults(result);
+                this.showAlert('success', `Added ${result.appended_count} candidates`);
+                this.showDuplicateReport(result);
+            } else {
+                this.showAlert('danger', result.error || 'Adding resumes failed');
+            }
+        } catch (error) {
+            console.error('Error adding resumes:', error);
+            this.showAlert('danger', 'An error occurred while adding resumes');
+        } finally {
+            this.hideLoading();
+        }
+    }
+    
+    async uploadFileInChunks(uploadId, file, chunkSize) {
+        const url = `/api/uploads/${uploadId}/files/${encodeURIComponent(file.name)}`;
+        
+        // Resume from whatever the server already has
+        let offset = (await (await fetch(url)).json()).offset || 0;
+        
+        do {
+            const end = Math.min(offset + chunkSize, file.size);
+            const final = end >= file.size ? 1 : 0;
+            const response = await fetch(`${url}?offset=${offset}&final=${final}`, {
+                method: 'PUT',
+                headers: { 'Content-Type': 'application/octet-stream' },
+                body: file.slice(offset, end)
+            });
+            const result = await response.json();
+            if (!response.ok) {
+                throw new Error(result.error || `Upload failed for ${file.name}`);
+            }
+            offset = end;
+        } while (offset < file.size);
+    }
+    
+    showDuplicateReport(result) {
+        const skipped = result.skipped_duplicates || [];
+        const merged = result.merged_duplicates || [];
+        if (skipped.length === 0 && merged.length === 0) return;
+        
+        const parts = [];
+        if (skipped.length > 0) {
+            parts.push(`Skipped identical files: ${skipped.map(escapeHtml).join(', ')}`);
+        }
+        merged.forEach(group => {
+            parts.push(`Merged ${group.merged.map(escapeHtml).join(', ')} into ${escapeHtml(group.kept)}`);
+        });
+        this.showAlert('info', parts.join('<br>'));
+    }
+    
     displayResults(result) {
         const resultsSection = document.getElementById('results-section');
-        const candidatesTable = document.getElementById('candidates-table');
-        const totalCandidates = document.getElementById('total-candidates');
         
         // Show results section
         resultsSection.style.display = 'block';
         
-        // Update total count
-        totalCandidates.textContent = result.candidates.length;
-        
-        // Clear and populate table
-        candidatesTable.innerHTML = '';
-        
+        // Start over with the first page; later pages load while scrolling
+        this.resultsVersion += 1;
+        this.totalCandidates = result.total_candidates;
+        this.rows = new Array(this.totalCandidates);
+        this.pendingPages.clear();
         result.candidates.forEach((candidate, index) => {
-            const row = this.createCandidateRow(candidate, index + 1);
-            candidatesTable.appendChild(row);
+            this.rows[index] = candidate;
         });
+        this.selection = { all: false, ids: new Set() };
+        
+        document.getElementById('total-candidates').textContent = this.totalCandidates;
+        document.getElementById('candidates-scroll').scrollTop = 0;
+        this.renderVisibleRows();
+        this.updateSelectedCandidates();
+        this.loadOverview();
         
         // Scroll to results
         resultsSection.scrollIntoView({ behavior: 'smooth' });
     }
     
+    renderVisibleRows() {
+        const container = document.getElementById('candidates-scroll');
+        const candidatesTable = document.getElementById('candidates-table');
+        
+        const first = Math.max(0, Math.floor(container.scrollTop / ROW_HEIGHT) - OVERSCAN_ROWS);
+        const last = Math.min(
+            this.totalCandidates,
+            Math.ceil((container.scrollTop + container.clientHeight) / ROW_HEIGHT) + OVERSCAN_ROWS
+        );
+        
+        candidatesTable.innerHTML = '';
+        candidatesTable.appendChild(this.createSpacerRow(first * ROW_HEIGHT));
+        for (let index = first; index < last; index++) {
+            const candidate = this.rows[index];
+            candidatesTable.appendChild(
+                candidate ? this.createCandidateRow(candidate, index + 1) : this.createPlaceholderRow(index + 1)
+            );
+        }
+        candidatesTable.appendChild(this.createSpacerRow((this.totalCandidates - last) * ROW_HEIGHT));
+        
+        for (let page = Math.floor(first / PAGE_SIZE); page * PAGE_SIZE < last; page++) {
+            this.loadPage(page);
+        }
+    }
+    
+    async loadPage(page) {
+        const offset = page * PAGE_SIZE;
+        if (this.rows[offset] || this.pendingPages.has(page)) return;
+        
+        const version = this.resultsVersion;
+        this.pendingPages.add(page);
+        try {
+            const response = await fetch(`/api/candidates?offset=${offset}&limit=${PAGE_SIZE}`);
+            const result = await response.json();
+            // Ignore pages of a ranking that has since been replaced
+            if (version !== this.resultsVersion) return;
+            result.candidates.forEach((candidate, index) => {
+                this.rows[offset + index] = candidate;
+            });
+            this.renderVisibleRows();
+        } catch (error) {
+            console.error('Error loading candidates:', error);
+        } finally {
+            if (version === this.resultsVersion) this.pendingPages.delete(page);
+        }
+    }
+    
+    async loadOverview() {
+        const overview = document.getElementById('results-overview');
+        try {
+            const stats = await (await fetch('/api/candidates/stats?bins=10&top_skills=15')).json();
+            const histogram = stats.scores.overall_score.histogram;
+            const maxCount = Math.max(1, ...histogram);
+            
+            const bars = histogram.map((count, index) => `
+                <div class="histogram-bar" title="${stats.bin_edges[index]}-${stats.bin_edges[index + 1]}%: ${count}">
+                    <div class="${this.getScoreClass(stats.bin_edges[index])}" style="height: ${(count / maxCount) * 100}%"></div>
+                </div>
+            `).join('');
+            const skills = stats.top_skills.map(s => `
+                <span class="badge bg-light text-dark me-1 mb-1">${escapeHtml(s.skill)} <strong>${s.count}</strong></span>
+            `).join('');
+            const overall = stats.scores.overall_score;
+            
+            overview.innerHTML = `
+                <div class="col-md-5">
+                    <h6>Overall Score Distribution</h6>
+                    <div class="histogram">${bars}</div>
+                    <div class="d-flex justify-content-between text-muted small"><span>0%</span><span>100%</span></div>
+                </div>
+                <div class="col-md-3">
+                    <h6>Summary</h6>
+                    <div class="small">Median: <strong>${overall.median ?? '-'}%</strong>, 90th percentile: <strong>${overall.p90 ?? '-'}%</strong></div>
+                    <span class="badge bg-success">80%+: ${stats.bands.high}</span>
+                    <span class="badge bg-warning">60-80%: ${stats.bands.medium}</span>
+                    <span class="badge bg-danger">&lt;60%: ${stats.bands.low}</span>
+                </div>
+                <div class="col-md-4">
+                    <h6>Top Skills</h6>
+                    <div>${skills}</div>
+                </div>
+            `;
+        } catch (error) {
+            console.error('Error loading score overview:', error);
+            overview.innerHTML = '';
+        }
+    }
+    
+    createSpacerRow(height) {
+        const row = document.createElement('tr');
+        row.style.height = `${height}px`;
+        return row;
+    }
+    
+    createPlaceholderRow(rank) {
+        const row = document.createElement('tr');
+        row.className = 'candidate-row';
+        row.innerHTML = `<td></td><td><strong>${rank}</strong></td><td colspan="7" class="text-muted">Loading...</td>`;
+        return row;
+    }
+    
     createCandidateRow(candidate, rank) {
         const row = document.createElement('tr');
         row.className = 'candidate-row';
@@ -151,21 +357,22 @@ class HRAgentApp {
         const expScoreClass = this.getScoreClass(candidate.experience_score);
         
         row.innerHTML = `
-            <td><input type="checkbox" class="candidate-checkbox" value="${candidate.name}"></td>
+            <td><input type="checkbox" class="candidate-checkbox" value="${candidate.id}"></td>
             <td><strong>${rank}</strong></td>
-            <td><strong>${candidate.name}</strong></td>
-            <td><small>${candidate.email}</small></td>
-            <td><span class="badge bg-secondary">${candidate.experience}</span></td>
+            <td><strong>${escapeHtml(candidate.name)}</strong></td>
+            <td><small>${escapeHtml(candidate.email)}</small></td>
+            <td><span class="badge bg-secondary">${escapeHtml(candidate.experience)}</span></td>
             <td><span class="badge ${skillScoreClass} score-badge">${candidate.skill_match_score}%</span></td>
             <td><span class="badge ${expScoreClass} score-badge">${candidate.experience_score}%</span></td>
             <td><span class="badge ${overallScoreClass} score-badge">${candidate.overall_score}%</span></td>
-            <td><span class="candidate-summary" title="${candidate.summary}">${candidate.summary}</span></td>
+            <td><span class="candidate-summary" title="${escapeHtml(candidate.summary)}">${escapeHtml(candidate.summary)}</span></td>
         `;
         
         // Add checkbox event listener
         const checkbox = row.querySelector('.candidate-checkbox');
+        checkbox.checked = this.isSelected(candidate.id);
         checkbox.addEventListener('change', () => {
-            this.updateSelectedCandidates();
+            this.setSelected(candidate.id, checkbox.checked);
         });
         
         return row;
@@ -177,44 +384,62 @@ class HRAgentApp {
         return 'bg-danger';
     }
     
+    isSelected(id) {
+        return this.selection.all !== this.selection.ids.has(id);
+    }
+    
+    setSelected(id, checked) {
+        // In "all" mode the set holds exclusions, so the meaning flips
+        if (checked !== this.selection.all) {
+            this.selection.ids.add(id);
+        } else {
+            this.selection.ids.delete(id);
+        }
+        this.updateSelectedCandidates();
+    }
+    
+    selectedCount() {
+        return this.selection.all
+            ? this.totalCandidates - this.selection.ids.size
+            : this.selection.ids.size;
+    }
+    
+    selectionRequest() {
+        // Selecting everyone is sent as a rule instead of every id
+        if (this.selection.all) {
+            return { top_n: this.totalCandidates, exclude_ids: Array.from(this.selection.ids) };
+        }
+        return { candidate_ids: Array.from(this.selection.ids) };
+    }
+    
     toggleSelectAll(checked) {
-        const checkboxes = document.querySelectorAll('.candidate-checkbox');
-        checkboxes.forEach(checkbox => {
-            checkbox.checked = checked;
-        });
+        this.selection = { all: checked, ids: new Set() };
+        this.renderVisibleRows();
         this.updateSelectedCandidates();
     }
     
     selectTopCandidates() {
-        // Uncheck all first
-        document.querySelectorAll('.candidate-checkbox').forEach(cb => cb.checked = false);
-        
-        // Select top 5
-        const topCheckboxes = document.querySelectorAll('.candidate-checkbox');
-        for (let i = 0; i < Math.min(5, topCheckboxes.length); i++) {
-            topCheckboxes[i].checked = true;
-        }
-        
+        // Select top 5 (always part of the first page)
+        const topIds = this.rows.slice(0, 5).filter(Boolean).map(c => c.id);
+        this.selection = { all: false, ids: new Set(topIds) };
+        this.renderVisibleRows();
         this.updateSelectedCandidates();
     }
     
     updateSelectedCandidates() {
-        const checkboxes = document.querySelectorAll('.candidate-checkbox:checked');
-        this.selectedCandidates = Array.from(checkboxes).map(cb => cb.value);
+        const count = this.selectedCount();
         
         // Enable/disable buttons
-        document.getElementById('scheduleBtn').disabled = this.selectedCandidates.length === 0;
+        document.getElementById('scheduleBtn').disabled = count === 0;
         
         // Update select all checkbox
         const selectAllCheckbox = document.getElementById('selectAll');
-        const allCheckboxes = document.querySelectorAll('.candidate-checkbox');
-        selectAllCheckbox.checked = this.selectedCandidates.length === allCheckboxes.length;
-        selectAllCheckbox.indeterminate = this.selectedCandidates.length > 0 && 
-            this.selectedCandidates.length < allCheckboxes.length;
+        selectAllCheckbox.checked = count > 0 && count === this.totalCandidates;
+        selectAllCheckbox.indeterminate = count > 0 && count < this.totalCandidates;
     }
     
     async scheduleInterviews() {
-        if (this.selectedCandidates.length === 0) {
+        if (this.selectedCount() === 0) {
             this.showAlert('warning', 'Please select candidates to schedule interviews.');
             return;
         }
@@ -232,17 +457,14 @@ class HRAgentApp {
             await fetch('/api/select_candidates', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ selected_candidates: this.selectedCandidates })
+                body: JSON.stringify(this.selectionRequest())
             });
             
             // Then schedule interviews using chosen start date
             const response = await fetch('/api/schedule_interviews', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    selected_candidates: this.selectedCandidates,
-                    start_date: startDate
-                })
+                body: JSON.stringify({ start_date: startDate })
             });
             
             const result = await response.json();
@@ -354,6 +576,14 @@ class HRAgentApp {
     }
 }
 
+// Filenames and resume fields come from uploads; escape them before
+// interpolating into HTML
+function escapeHtml(value) {
+    return String(value ?? '').replace(/[&<>"']/g, ch => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    })[ch]);
+}
+
 // Initialize app
 document.addEventListener('DOMContentLoaded', () => {
     window.hrAgentApp = new HRAgentApp();
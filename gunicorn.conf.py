@@ -0,0 +1,43 @@
+"""
+Gunicorn configuration for serving the HR AI Agent in production.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The app (and with it every model) is loaded once in the master process
+before the workers are forked, so all workers share the model weights
+copy-on-write instead of each loading their own copy. Tune with the
+WEB_WORKERS, WEB_THREADS, INFERENCE_THREADS and TORCH_THREADS environment
+variables (see config/config.py).
+
+The app keeps the current job, ranking, selection and streaming upload
+sessions in module globals, i.e. per worker process. Requests of one
+upload -> process -> select -> schedule flow must therefore all reach the
+same process, so the default is a single worker serving requests from
+WEB_THREADS threads. Raising WEB_WORKERS above 1 is only safe once that
+state is kept in a shared store (e.g. SQLite or Redis).
+"""
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+# Share the cores between workers rather than letting every worker's
+# parsing pool and torch use all of them (must be set before Config loads)
+_cores = os.cpu_count() or 1
+_workers = int(os.environ.get('WEB_WORKERS', 1))
+os.environ.setdefault('PARSE_WORKERS', str(max(1, _cores // _workers)))
+os.environ.setdefault('TORCH_THREADS', str(max(1, _cores // _workers)))
+
+from config.config import Config
+
+bind = Config.SERVER_BIND
+workers = Config.SERVER_WORKERS
+worker_class = 'gthread'
+threads = Config.SERVER_THREADS
+timeout = Config.SERVER_TIMEOUT
+preload_app = True
+
+
+def post_fork(server, worker):
+    from backend.app import inference
+    inference.configure_torch()
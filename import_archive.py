@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - Archive Import Script
+
+Screens every resume PDF in a ZIP or tar archive (e.g. an ATS export)
+against one job description and writes the ranking to a CSV file.
+
+Example:
+    python import_archive.py applicants.zip --title "Backend Engineer" \
+        --description "Build APIs in Python" --skills "Python, Flask, SQL" \
+        --experience "3+ years" --output ranking.csv
+"""
+
+import argparse
+import csv
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from backend.models.candidate import JobDescription
+from backend.utils.archive_import import ArchiveImporter, ArchiveImportProgress
+from backend.utils.ingestion import ResumeIngestionPool
+from config.config import Config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import and rank resumes from a ZIP/tar archive")
+    parser.add_argument('archive', help="Path to a .zip, .tar, .tar.gz, .tgz, .tar.bz2 or .tar.xz file")
+    parser.add_argument('--title', required=True, help="Job title")
+    parser.add_argument('--description', required=True, help="Job description text")
+    parser.add_argument('--skills', default='', help="Comma-separated required skills")
+    parser.add_argument('--experience', default='', help="Experience required, e.g. '3+ years'")
+    parser.add_argument('--qualifications', default='')
+    parser.add_argument('--output', default='ranking.csv', help="CSV file for the ranked candidates")
+    parser.add_argument('--batch-size', type=int, default=Config.ARCHIVE_BATCH_SIZE)
+    parser.add_argument('--workers', type=int, default=Config.PARSE_WORKERS)
+    return parser.parse_args()
+
+
+def print_progress(progress: ArchiveImportProgress):
+    total = progress.total_members if progress.total_members is not None else '?'
+    print(f"\r  {progress.processed}/{total} members, {progress.parsed} parsed, "
+          f"{progress.duplicates} duplicates, {len(progress.errors)} errors", end='', flush=True)
+
+
+def write_csv(path, ranked_candidates):
+    with open(path, 'w', newline='') as output:
+        writer = csv.writer(output)
+        writer.writerow(['rank', 'name', 'email', 'phone', 'experience', 'skills',
+                         'skill_match_score', 'experience_score', 'overall_score', 'file'])
+        for rank, candidate in enumerate(ranked_candidates, start=1):
+            writer.writerow([
+                rank, candidate.name, candidate.email, candidate.phone or '',
+                candidate.experience, ', '.join(candidate.skills),
+                round(float(candidate.skill_match_score) * 100, 2),
+                round(float(candidate.experience_score) * 100, 2),
+                round(float(candidate.overall_score) * 100, 2),
+                candidate.filename
+            ])
+
+
+def main():
+    args = parse_args()
+    job_description = JobDescription(
+        title=args.title,
+        description=args.description,
+        required_skills=[s.strip() for s in args.skills.split(',') if s.strip()],
+        experience_required=args.experience,
+        qualifications=args.qualifications
+    )
+    
+    # Imported here so --help works without loading the models
+    from backend.agents.resume_processor import ResumeProcessor
+    from backend.agents.candidate_ranker import CandidateRanker
+    
+    print("Loading models...")
+    resume_processor = ResumeProcessor()
+    candidate_ranker = CandidateRanker()
+    
+    ingestion_pool = ResumeIngestionPool(args.workers, resume_processor.parse_cache)
+    importer = ArchiveImporter(ingestion_pool, args.batch_size, Config.ARCHIVE_MAX_MEMBER_SIZE)
+    progress = ArchiveImportProgress(archive=os.path.basename(args.archive))
+    candidates = []
+    
+    def on_batch(results):
+        for member_path, content_hash, fields in results:
+            candidate = resume_processor.candidate_from_fields(member_path, fields)
+            candidate.content_hash = content_hash
+            candidates.append(candidate)
+        print_progress(progress)
+    
+    print(f"Importing {args.archive}...")
+    try:
+        importer.import_archive(args.archive, on_batch, progress)
+    finally:
+        ingestion_pool.shutdown()
+    print_progress(progress)
+    print()
+    
+    for error in progress.errors:
+        print(f"  ! {error['member']}: {error['error']}")
+    
+    if not candidates:
+        print("No resumes could be imported.")
+        return 1
+    
+    print(f"Summarizing and ranking {len(candidates)} candidates...")
+    candidates = resume_processor.finalize_candidates(candidates, job_description)
+    ranked_candidates = candidate_ranker.rank_candidates(candidates, job_description)
+    write_csv(args.output, ranked_candidates)
+    print(f"Wrote {len(ranked_candidates)} ranked candidates to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - Load Test Script
+
+Fires concurrent requests at a running server and reports requests per
+second and latency percentiles. Compare e.g. the development server with
+the gunicorn setup:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+    python load_test.py --path /api/get_status --requests 2000 --concurrency 32
+    python load_test.py --path /api/rank_jobs --method POST --json jobs.json \
+        --requests 200 --concurrency 8
+
+With --flow, every request is a whole screening pass instead of a single
+call: the PDFs in a directory are streamed to a new upload session,
+processed against a job and the top candidates selected. Latencies are
+reported per step:
+
+    python load_test.py --flow sample_resumes --requests 20
+
+Flows run one after another (--concurrency is ignored): the server keeps a
+single current job, ranking and selection, so concurrent flows would
+overwrite each other's state. The flow stops before scheduling, since
+/api/schedule_interviews creates real calendar events.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+FLOW_STEPS = ['upload', 'process', 'select']
+
+DEFAULT_JOB = {
+    'job_title': 'Software Engineer',
+    'job_description': 'Build and maintain backend services in Python.',
+    'required_skills': 'Python, SQL, Docker',
+    'experience_required': '3+ years',
+    'qualifications': "Bachelor's degree in Computer Science"
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Measure requests per second against the HR AI Agent")
+    parser.add_argument('--url', default='http://localhost:5000', help="Server base URL")
+    parser.add_argument('--path', default='/api/get_status', help="Endpoint to call")
+    parser.add_argument('--method', default='GET', choices=['GET', 'POST'])
+    parser.add_argument('--json', default=None,
+                        help="File with a JSON request body (POST); with --flow, the job fields")
+    parser.add_argument('--flow', default=None, metavar='RESUME_DIR',
+                        help="Run upload -> process -> select, one flow at a time, with the PDFs in RESUME_DIR")
+    parser.add_argument('--top-n', type=int, default=3, help="Candidates selected per flow")
+    parser.add_argument('--requests', type=int, default=500, help="Total number of requests (or flows)")
+    parser.add_argument('--concurrency', type=int, default=16, help="Parallel clients")
+    parser.add_argument('--timeout', type=float, default=300)
+    return parser.parse_args()
+
+
+def call(url, method, body, timeout, content_type='application/json'):
+    """Return (latency in seconds, HTTP status or error string, decoded JSON reply or None)"""
+    headers = {'Content-Type': content_type} if body is not None else {}
+    req = urllib.request.Request(url, data=body, method=method, headers=headers)
+    start = time.perf_counter()
+    payload = None
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            data = response.read()
+            status = response.status
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            pass
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception as e:
+        status = type(e).__name__
+    return time.perf_counter() - start, status, payload
+
+
+def send_request(url, method, body, timeout):
+    """Return (latency in seconds, HTTP status or error string)"""
+    latency, status, _ = call(url, method, body, timeout)
+    return latency, status
+
+
+def run_flow(base_url, resumes, job, top_n, timeout):
+    """One upload -> process -> select pass; returns {step: (latency, status)}.
+    
+    Later steps are skipped once a step fails, since they depend on its state.
+    """
+    results = {}
+    
+    def step(name, path, method='POST', body=None, content_type='application/json'):
+        latency, status, payload = call(base_url + path, method, body, timeout, content_type)
+        results[name] = (results.get(name, (0, None))[0] + latency, status)
+        return status == 200, payload
+    
+    ok, session = step('upload', '/api/uploads')
+    if not ok:
+        return results
+    upload_id = session['upload_id']
+    for path in resumes:
+        with open(path, 'rb') as f:
+            data = f.read()
+        name = urllib.parse.quote(os.path.basename(path))
+        ok, _ = step('upload', f"/api/uploads/{upload_id}/files/{name}?offset=0&final=true",
+                     method='PUT', body=data, content_type='application/octet-stream')
+        if not ok:
+            return results
+    
+    ok, _ = step('process', f"/api/uploads/{upload_id}/process", body=json.dumps(job).encode())
+    if not ok:
+        return results
+    step('select', '/api/select_candidates', body=json.dumps({'top_n': top_n}).encode())
+    return results
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def report(results, elapsed, count):
+    latencies = sorted(latency for latency, _ in results)
+    statuses = {}
+    for _, status in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    
+    print(f"Total time:    {elapsed:.2f}s")
+    print(f"Requests/sec:  {count / elapsed:.1f}")
+    print(f"Latency mean:  {statistics.mean(latencies) * 1000:.1f} ms")
+    for label, fraction in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+        print(f"Latency {label}:   {percentile(latencies, fraction) * 1000:.1f} ms")
+    print(f"Status codes:  {statuses}")
+
+
+def main_flow(args):
+    base_url = args.url.rstrip('/')
+    resumes = sorted(
+        os.path.join(args.flow, name) for name in os.listdir(args.flow)
+        if name.lower().endswith('.pdf')
+    )
+    if not resumes:
+        raise SystemExit(f"No PDF files in {args.flow}")
+    
+    job = DEFAULT_JOB
+    if args.json:
+        with open(args.json) as f:
+            job = json.load(f)
+    
+    print(f"Flow against {base_url} with {len(resumes)} resumes: {args.requests} flows, one at a time")
+    
+    # Serial on purpose: the server holds one current ranking and selection
+    start = time.perf_counter()
+    flows = [run_flow(base_url, resumes, job, args.top_n, args.timeout) for _ in range(args.requests)]
+    elapsed = time.perf_counter() - start
+    
+    completed = sum(1 for flow in flows if flow.get('select', (0, None))[1] == 200)
+    print(f"Completed:     {completed}/{args.requests} flows")
+    for name in FLOW_STEPS:
+        results = [flow[name] for flow in flows if name in flow]
+        if results:
+            print(f"\n[{name}]")
+            report(results, elapsed, len(results))
+
+
+def main():
+    args = parse_args()
+    if args.flow:
+        main_flow(args)
+        return
+    
+    url = args.url.rstrip('/') + args.path
+    body = None
+    if args.json:
+        with open(args.json) as f:
+            body = json.dumps(json.load(f)).encode()
+    
+    print(f"{args.method} {url}: {args.requests} requests, concurrency {args.concurrency}")
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(
+            lambda _: send_request(url, args.method, body, args.timeout),
+            range(args.requests)
+        ))
+    elapsed = time.perf_counter() - start
+    
+    report(results, elapsed, args.requests)
+
+
+if __name__ == '__main__':
+    main()
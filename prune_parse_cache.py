@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - Parse Cache Maintenance
+
+Lookups only see entries of the running parser version, so entries left by
+older parser versions or other PDF backend settings just take up space.
+This removes them and optionally caps the cache at the newest N entries:
+
+    python prune_parse_cache.py
+    python prune_parse_cache.py --max-entries 100000
+    python prune_parse_cache.py --keep-version "1:pdfium+pdfminer:10" --keep-version "1:pypdf2:10"
+
+Run it when no server or batch job with another configuration still needs
+its entries.
+"""
+
+import argparse
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from config.config import Config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Remove stale entries from the parsed-resume cache")
+    parser.add_argument('--cache', default=Config.PARSE_CACHE_PATH, help="Cache database file")
+    parser.add_argument('--keep-version', action='append', default=None,
+                        help="Parser version to keep (repeatable); default: the current configuration's")
+    parser.add_argument('--max-entries', type=int, default=None, help="Keep at most this many newest entries")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not args.cache or not os.path.exists(args.cache):
+        print(f"No parse cache at {args.cache}")
+        return 0
+    
+    from backend.utils.parse_cache import ParseCache
+    from backend.utils.pdf_parser import PDFParser
+    
+    cache = ParseCache(args.cache, PDFParser().version)
+    print(f"Before: {cache.count()}")
+    deleted = cache.prune(args.keep_version, args.max_entries)
+    print(f"Deleted {deleted} entries")
+    print(f"After:  {cache.count()}")
+    cache.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,6 +13,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import os
 import sys
 from backend.app import app
+from config.config import Config
 
 if __name__ == '__main__':
     # Set environment variables if not already set
@@ -31,8 +32,12 @@ if __name__ == '__main__':
     print("=" * 50)
     
     try:
+        # Development server only; use gunicorn for production:
+        #   gunicorn -c gunicorn.conf.py wsgi:app
+        # The reloader is off because it would load every model twice
         app.run(
-            debug=True,
+            debug=Config.DEBUG,
+            use_reloader=False,
             host='0.0.0.0',
             port=5000,
             threaded=True
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+HR AI Agent - Inference Server
+
+Loads the embedding and summarization models once and serves them to all
+web workers over a Unix socket, micro-batching concurrent requests:
+
+    INFERENCE_SOCKET=/tmp/hr_inference.sock python run_inference_server.py
+    INFERENCE_SOCKET=/tmp/hr_inference.sock gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from config.config import Config
+
+
+def main():
+    if not Config.INFERENCE_SOCKET:
+        print("Set INFERENCE_SOCKET to the Unix socket path to listen on.")
+        return 1
+    
+    from sentence_transformers import SentenceTransformer
+    from transformers import pipeline
+    from backend.utils.inference_server import InferenceServer
+    
+    print("Loading models...")
+    server = InferenceServer(
+        Config.INFERENCE_SOCKET,
+        embedding_model=SentenceTransformer(Config.EMBEDDING_MODEL),
+        summarizer=pipeline("summarization", model=Config.SUMMARIZATION_MODEL),
+        authkey=Config.SECRET_KEY.encode(),
+        max_batch_size=Config.INFERENCE_MAX_BATCH,
+        max_wait_ms=Config.INFERENCE_MAX_WAIT_MS,
+        summary_batch_size=Config.SUMMARY_BATCH_SIZE,
+        embedding_batch_size=Config.EMBEDDING_BATCH_SIZE
+    )
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down inference server...")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
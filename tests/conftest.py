@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Import backend and config from the repository root, as the run scripts do
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
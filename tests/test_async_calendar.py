@@ -0,0 +1,185 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from backend.utils.async_calendar import AsyncCalendarClient
+from backend.utils.calendar_integration import GoogleCalendarIntegration
+
+
+class FakeCalendarAPI:
+    """Stand-in for the events.insert endpoint of the Google Calendar API.
+    
+    Events whose summary mentions "slow" are held until ``release`` is set,
+    and "fail" answers HTTP 500; everything else is created at once.
+    """
+    
+    def __init__(self):
+        self.received = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.created = []
+        self.release = asyncio.Event()
+        self.saturated = asyncio.Event()
+        self.saturation = None
+    
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/calendars/primary/events', self.insert_event)
+        return app
+    
+    async def insert_event(self, request: web.Request) -> web.Response:
+        assert request.headers['Authorization'] == 'Bearer test-token'
+        assert request.query['conferenceDataVersion'] == '1'
+        body = await request.json()
+        
+        self.received += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.in_flight == self.saturation:
+            self.saturated.set()
+        try:
+            await asyncio.sleep(0.05)
+            if 'slow' in body['summary']:
+                await self.release.wait()
+            if 'fail' in body['summary']:
+                return web.json_response({'error': 'backend error'}, status=500)
+        finally:
+            self.in_flight -= 1
+        
+        event_id = f"event{len(self.created)}"
+        self.created.append(body)
+        return web.json_response({
+            **body,
+            'id': event_id,
+            'htmlLink': f"https://calendar.example.com/{event_id}",
+            'conferenceData': {'entryPoints': [{'uri': f"https://meet.example.com/{event_id}"}]}
+        })
+
+
+@pytest.fixture
+def calendar_integration(tmp_path, monkeypatch):
+    integration = GoogleCalendarIntegration(
+        credentials_file=str(tmp_path / 'credentials.json'),
+        token_file=str(tmp_path / 'token.json'),
+        cache_file=str(tmp_path / 'calendar_cache.sqlite3')
+    )
+    monkeypatch.setattr(integration, 'get_access_token', lambda: 'test-token')
+    yield integration
+    integration.mirror.close()
+
+
+def interview_requests(names):
+    start = datetime(2030, 1, 7, 9, 0)
+    return [
+        {
+            'candidate_name': name,
+            'candidate_email': f"{name.replace(' ', '.')}@example.com",
+            'start_time': start + timedelta(hours=i),
+            'duration_minutes': 60
+        }
+        for i, name in enumerate(names)
+    ]
+
+
+async def run_against(api, make_client, scenario):
+    async with TestServer(api.app()) as server:
+        client = make_client(f"http://{server.host}:{server.port}")
+        try:
+            return await scenario(client)
+        finally:
+            api.release.set()
+
+
+def test_creates_events_and_records_them(calendar_integration):
+    api = FakeCalendarAPI()
+    requests = interview_requests([f"Candidate {i}" for i in range(5)])
+    
+    details = asyncio.run(run_against(
+        api,
+        lambda url: AsyncCalendarClient(calendar_integration, api_url=url),
+        lambda client: client.create_interview_events_async(requests)
+    ))
+    
+    assert len(api.created) == 5
+    assert len({d['event_id'] for d in details}) == 5
+    assert all(d['meet_link'].startswith('https://meet.example.com/') for d in details)
+    assert {e['summary'] for e in api.created} == {f"Interview with Candidate {i}" for i in range(5)}
+    # Created events are busy in the local mirror right away
+    assert not calendar_integration.mirror.is_free(
+        'primary', requests[0]['start_time'], requests[0]['start_time'] + timedelta(minutes=30)
+    )
+
+
+def test_failed_and_timed_out_requests_return_none(calendar_integration):
+    api = FakeCalendarAPI()
+    requests = interview_requests(['Candidate ok', 'Candidate fail', 'Candidate slow', 'Candidate ok2'])
+    
+    details = asyncio.run(run_against(
+        api,
+        lambda url: AsyncCalendarClient(calendar_integration, timeout=0.5, api_url=url),
+        lambda client: client.create_interview_events_async(requests)
+    ))
+    
+    assert details[0] is not None and details[3] is not None
+    assert details[1] is None  # HTTP 500
+    assert details[2] is None  # per-request timeout
+
+
+def test_total_timeout_cancels_remaining_requests(calendar_integration):
+    api = FakeCalendarAPI()
+    requests = interview_requests(['Candidate slow 1', 'Candidate slow 2', 'Candidate ok'])
+    
+    start = time.perf_counter()
+    details = asyncio.run(run_against(
+        api,
+        lambda url: AsyncCalendarClient(calendar_integration, timeout=30, total_timeout=0.5, api_url=url),
+        lambda client: client.create_interview_events_async(requests)
+    ))
+    
+    assert time.perf_counter() - start < 5
+    assert details[0] is None and details[1] is None
+    assert details[2] is not None
+
+
+def test_concurrency_is_bounded(calendar_integration):
+    api = FakeCalendarAPI()
+    requests = interview_requests([f"Candidate {i}" for i in range(30)])
+    
+    details = asyncio.run(run_against(
+        api,
+        lambda url: AsyncCalendarClient(calendar_integration, max_concurrency=4, api_url=url),
+        lambda client: client.create_interview_events_async(requests)
+    ))
+    
+    assert all(d is not None for d in details)
+    assert api.max_in_flight == 4
+
+
+def test_cancelling_the_caller_cancels_in_flight_requests(calendar_integration):
+    api = FakeCalendarAPI()
+    api.saturation = 3
+    requests = interview_requests([f"Candidate slow {i}" for i in range(10)])
+    
+    async def scenario(client):
+        task = asyncio.ensure_future(client.create_interview_events_async(requests))
+        await asyncio.wait_for(api.saturated.wait(), 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.2)
+        # The queued requests were never sent, the in-flight ones never completed
+        assert api.received == 3
+        assert api.created == []
+    
+    start = time.perf_counter()
+    asyncio.run(run_against(
+        api,
+        lambda url: AsyncCalendarClient(calendar_integration, max_concurrency=3, api_url=url),
+        scenario
+    ))
+    
+    assert time.perf_counter() - start < 5
@@ -0,0 +1,155 @@
+from datetime import datetime, timezone
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from backend.utils.calendar_cache import CalendarMirror
+
+
+class FakeEventsService:
+    """Stand-in for ``service.events().list(**params).execute()``.
+    
+    ``pages`` maps a sync token (None for a full listing) to the pages the
+    API answers with; each page is a dict as events.list returns it. Tokens
+    in ``expired`` answer 410 Gone. Every call's params are recorded.
+    """
+    
+    def __init__(self, pages, expired=()):
+        self.pages = pages
+        self.expired = set(expired)
+        self.calls = []
+    
+    def events(self):
+        return self
+    
+    def list(self, **params):
+        self.calls.append(dict(params))
+        self._params = params
+        return self
+    
+    def execute(self):
+        params = self._params
+        sync_token = params.get('syncToken')
+        if sync_token in self.expired:
+            raise HttpError(httplib2.Response({'status': 410}), b'{"error": "fullSyncRequired"}')
+        pages = self.pages[sync_token]
+        index = int(params['pageToken']) if 'pageToken' in params else 0
+        return pages[index]
+
+
+def event(event_id, hour, **fields):
+    return {
+        'id': event_id,
+        'summary': f"Event {event_id}",
+        'start': {'dateTime': f"2030-01-07T{hour:02d}:00:00Z"},
+        'end': {'dateTime': f"2030-01-07T{hour + 1:02d}:00:00Z"},
+        **fields
+    }
+
+
+def at(hour):
+    return datetime(2030, 1, 7, hour, 0, tzinfo=timezone.utc)
+
+
+def busy_hours(mirror, calendar_id='primary'):
+    return [start.hour for start, _ in mirror.busy(calendar_id, at(0), at(23))]
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = CalendarMirror(str(tmp_path / 'calendar_cache.sqlite3'))
+    yield mirror
+    mirror.close()
+
+
+def test_full_then_incremental_sync(mirror):
+    service = FakeEventsService({
+        None: [{'items': [event('a', 9), event('b', 11)], 'nextSyncToken': 'token1'}],
+        'token1': [{'items': [event('c', 14), event('b', 12)], 'nextSyncToken': 'token2'}]
+    })
+    
+    assert mirror.sync(service) == 2
+    assert mirror.get_sync_token('primary') == 'token1'
+    assert busy_hours(mirror) == [9, 11]
+    assert 'syncToken' not in service.calls[0]
+    
+    assert mirror.sync(service) == 2
+    assert service.calls[1]['syncToken'] == 'token1'
+    assert mirror.get_sync_token('primary') == 'token2'
+    # The moved event replaces its old slot, the rest of the mirror is kept
+    assert busy_hours(mirror) == [9, 12, 14]
+    assert mirror.is_free('primary', at(11), at(12))
+    assert not mirror.is_free('primary', at(14), at(15))
+
+
+def test_expired_sync_token_falls_back_to_full_sync(mirror):
+    service = FakeEventsService({
+        None: [{'items': [event('a', 9), event('b', 11)], 'nextSyncToken': 'token1'}]
+    })
+    mirror.sync(service)
+    
+    service.pages[None] = [{'items': [event('b', 11), event('c', 15)], 'nextSyncToken': 'token2'}]
+    service.expired.add('token1')
+    
+    assert mirror.sync(service) == 2
+    assert service.calls[1]['syncToken'] == 'token1'
+    assert 'syncToken' not in service.calls[2]
+    assert mirror.get_sync_token('primary') == 'token2'
+    # A full sync replaces the mirror, so 'a' (deleted meanwhile) is gone
+    assert busy_hours(mirror) == [11, 15]
+
+
+def test_other_errors_are_raised(mirror):
+    service = FakeEventsService({}, expired={None})
+    
+    # Without a sync token there is nothing to fall back from
+    with pytest.raises(HttpError):
+        mirror.sync(service)
+    assert mirror.get_sync_token('primary') is None
+
+
+def test_cancelled_and_transparent_events_are_removed(mirror):
+    service = FakeEventsService({
+        None: [{'items': [event('a', 9), event('b', 11), event('c', 13)], 'nextSyncToken': 'token1'}],
+        'token1': [{
+            'items': [
+                {'id': 'a', 'status': 'cancelled'},
+                event('b', 11, transparency='transparent'),
+                event('d', 16, status='cancelled')
+            ],
+            'nextSyncToken': 'token2'
+        }]
+    })
+    mirror.sync(service)
+    mirror.sync(service)
+    
+    assert busy_hours(mirror) == [13]
+
+
+def test_all_pages_are_read(mirror):
+    service = FakeEventsService({
+        None: [
+            {'items': [event('a', 9)], 'nextPageToken': '1'},
+            {'items': [event('b', 11)], 'nextPageToken': '2'},
+            {'items': [event('c', 13)], 'nextSyncToken': 'token1'}
+        ]
+    })
+    
+    assert mirror.sync(service) == 3
+    assert [call.get('pageToken') for call in service.calls] == [None, '1', '2']
+    assert mirror.get_sync_token('primary') == 'token1'
+    assert busy_hours(mirror) == [9, 11, 13]
+
+
+def test_calendars_are_mirrored_separately(mirror):
+    service = FakeEventsService({
+        None: [{'items': [event('a', 9)], 'nextSyncToken': 'token1'}]
+    })
+    mirror.sync(service, 'primary')
+    service.pages[None] = [{'items': [event('a', 10)], 'nextSyncToken': 'other1'}]
+    mirror.sync(service, 'interviewer@example.com')
+    
+    assert busy_hours(mirror) == [9]
+    assert busy_hours(mirror, 'interviewer@example.com') == [10]
+    assert service.calls[1]['calendarId'] == 'interviewer@example.com'
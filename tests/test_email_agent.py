@@ -0,0 +1,135 @@
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from backend.agents.email_agent import EmailAgent
+from backend.models.candidate import Candidate
+
+
+class RecordingHandler:
+    """aiosmtpd handler that keeps every accepted message and refuses
+    recipients at reject.example.com"""
+    
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.messages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+    
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.endswith('@reject.example.com'):
+            return '550 Mailbox unavailable'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+    
+    async def handle_DATA(self, server, session, envelope):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        self.messages.append((envelope.mail_from, list(envelope.rcpt_tos), envelope.content))
+        return '250 Message accepted for delivery'
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_stub(request):
+    handler = RecordingHandler(**getattr(request, 'param', {}))
+    controller = Controller(handler, hostname='127.0.0.1', port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+def make_agent(controller, use_async=True, max_concurrency=10) -> EmailAgent:
+    agent = EmailAgent(use_async=use_async)
+    agent.smtp_server = controller.hostname
+    agent.smtp_port = controller.port
+    agent.smtp_starttls = False
+    agent.email_address = 'hr@example.com'
+    agent.email_password = None
+    agent.max_concurrency = max_concurrency
+    agent.timeout = 5
+    agent.total_timeout = 30
+    return agent
+
+
+def scheduled_candidates(emails):
+    candidates = []
+    for i, email in enumerate(emails):
+        candidate = Candidate(
+            name=f"Candidate {i}", email=email, phone=None, experience='', skills=[],
+            education='', resume_text='', filename=f"candidate{i}.pdf"
+        )
+        candidate.interview_scheduled = True
+        candidate.interview_link = f"https://meet.example.com/{i}"
+        candidates.append(candidate)
+    return candidates
+
+
+def test_async_sends_one_email_per_scheduled_candidate(smtp_stub):
+    controller, handler = smtp_stub
+    candidates = scheduled_candidates([f"candidate{i}@example.com" for i in range(5)])
+    candidates[4].interview_scheduled = False
+    
+    result = make_agent(controller).send_interview_confirmations(candidates)
+    
+    assert result['sent_count'] == 4
+    assert result['failed_sends'] == []
+    assert sorted(rcpt for _, (rcpt,), _ in handler.messages) == [
+        f"candidate{i}@example.com" for i in range(4)
+    ]
+    assert all(mail_from == 'hr@example.com' for mail_from, _, _ in handler.messages)
+    assert b'Interview Confirmation - Candidate 0' in next(
+        content for _, (rcpt,), content in handler.messages if rcpt == 'candidate0@example.com'
+    )
+
+
+def test_async_reports_refused_recipients(smtp_stub):
+    controller, handler = smtp_stub
+    candidates = scheduled_candidates(['ok@example.com', 'nobody@reject.example.com'])
+    
+    result = make_agent(controller).send_interview_confirmations(candidates)
+    
+    assert result['sent_count'] == 1
+    assert result['failed_sends'] == ['Candidate 1']
+
+
+@pytest.mark.parametrize('smtp_stub', [{'delay': 0.2}], indirect=True)
+def test_async_sends_concurrently_within_the_limit(smtp_stub):
+    controller, handler = smtp_stub
+    candidates = scheduled_candidates([f"candidate{i}@example.com" for i in range(12)])
+    
+    start = time.perf_counter()
+    result = make_agent(controller, max_concurrency=4).send_interview_confirmations(candidates)
+    elapsed = time.perf_counter() - start
+    
+    assert result['sent_count'] == 12
+    assert handler.max_in_flight == 4
+    # Three rounds of four instead of twelve sequential sends
+    assert elapsed < 12 * 0.2
+
+
+def test_sync_path_matches_async(smtp_stub):
+    controller, handler = smtp_stub
+    candidates = scheduled_candidates(['a@example.com', 'b@reject.example.com'])
+    
+    result = make_agent(controller, use_async=False).send_interview_confirmations(candidates)
+    
+    assert result['sent_count'] == 1
+    assert result['failed_sends'] == ['Candidate 1']
+    assert [rcpt for _, (rcpt,), _ in handler.messages] == ['a@example.com']
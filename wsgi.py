@@ -0,0 +1,15 @@
+"""
+HR AI Agent - WSGI entry point
+
+Production serving:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from backend.app import app, inference
+
+# Per-process torch settings (gunicorn.conf.py calls this again after fork)
+inference.configure_torch()